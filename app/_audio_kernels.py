@@ -0,0 +1,48 @@
+import sys
+
+import numpy as np
+
+# A frozen build has no writable cache directory, so numba would JIT on every start
+try:
+    if getattr(sys, 'frozen', False):
+        raise ImportError("numba kernels are not used in frozen builds")
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    njit = None
+
+
+def _f32_to_i16_numpy(a: np.ndarray, out: np.ndarray, scratch: np.ndarray):
+    """Clamp a to [-1, 1] and write it to out scaled to int16, in three NumPy passes."""
+    n = a.shape[0]
+    buf = scratch[:n]
+    # clip(x, -1, 1) * 32767 == clip(x * 32767, -32767, 32767)
+    np.multiply(a, 32767, out=buf)
+    np.clip(buf, -32767, 32767, out=buf)
+    np.copyto(out[:n], buf, casting='unsafe')
+
+
+if NUMBA_AVAILABLE:
+    # Compiled on first call (see warm_up) and cached on disk
+    @njit(fastmath=True, cache=True)
+    def _f32_to_i16_numba(a, out):
+        for i in range(a.shape[0]):
+            v = a[i]
+            v = 1.0 if v > 1.0 else (-1.0 if v < -1.0 else v)
+            out[i] = np.int16(v * 32767.0)
+
+    def f32_to_i16(a: np.ndarray, out: np.ndarray, scratch: np.ndarray):
+        """Clamp a to [-1, 1] and write it to out scaled to int16 in one fused loop."""
+        _f32_to_i16_numba(a, out)
+
+    def warm_up():
+        """Compile the kernel for float32 and float64 input ahead of the first clip."""
+        out = np.empty(1, dtype=np.int16)
+        for dtype in (np.float32, np.float64):
+            _f32_to_i16_numba(np.zeros(1, dtype=dtype), out)
+else:
+    f32_to_i16 = _f32_to_i16_numpy
+
+    def warm_up():
+        pass
@@ -1,34 +1,77 @@
+import ctypes
 import logging
 import time
-from typing import Optional
+from ctypes import wintypes
+from typing import Optional, Sequence, Tuple
 
 import pyperclip
+import win32clipboard
 import win32gui
-import win32api
 import win32con
 
+INPUT_KEYBOARD = 1
+
+class MOUSEINPUT(ctypes.Structure):
+    _fields_ = [("dx", wintypes.LONG),
+                ("dy", wintypes.LONG),
+                ("mouseData", wintypes.DWORD),
+                ("dwFlags", wintypes.DWORD),
+                ("time", wintypes.DWORD),
+                ("dwExtraInfo", ctypes.c_size_t)]
+
+class KEYBDINPUT(ctypes.Structure):
+    _fields_ = [("wVk", wintypes.WORD),
+                ("wScan", wintypes.WORD),
+                ("dwFlags", wintypes.DWORD),
+                ("time", wintypes.DWORD),
+                ("dwExtraInfo", ctypes.c_size_t)]
+
+class HARDWAREINPUT(ctypes.Structure):
+    _fields_ = [("uMsg", wintypes.DWORD),
+                ("wParamL", wintypes.WORD),
+                ("wParamH", wintypes.WORD)]
+
+class _INPUTUNION(ctypes.Union):
+    # MOUSEINPUT is the largest member and fixes sizeof(INPUT) expected by SendInput
+    _fields_ = [("mi", MOUSEINPUT),
+                ("ki", KEYBDINPUT),
+                ("hi", HARDWAREINPUT)]
+
+class INPUT(ctypes.Structure):
+    _fields_ = [("type", wintypes.DWORD),
+                ("u", _INPUTUNION)]
+
+_user32 = ctypes.WinDLL('user32', use_last_error=True)
+_user32.SendInput.restype = wintypes.UINT
+_user32.SendInput.argtypes = [wintypes.UINT, ctypes.POINTER(INPUT), ctypes.c_int]
+
 class ClipboardManager:    
     def __init__(self, key_simulation_delay, auto_paste, preserve_clipboard):
         self.logger = logging.getLogger(__name__)
         self.key_simulation_delay = key_simulation_delay
         self.auto_paste = auto_paste
         self.preserve_clipboard = preserve_clipboard
-        self._test_clipboard_access()
+        # Key sequences are fixed, so build the SendInput arrays once
+        self._input_size = ctypes.sizeof(INPUT)
+        self._send_input = _user32.SendInput
+        self._ctrl_v_inputs = self._build_key_inputs((
+            (win32con.VK_CONTROL, False),
+            (ord('V'), False),
+            (ord('V'), True),
+            (win32con.VK_CONTROL, True),
+        ))
+        self._enter_inputs = self._build_key_inputs((
+            (win32con.VK_RETURN, False),
+            (win32con.VK_RETURN, True),
+        ))
+        # No clipboard probe here: opening it at startup can block while another
+        # app holds it; access failures are reported where a real copy fails.
         self._print_status()
     
-    def _test_clipboard_access(self):
-        try:
-            pyperclip.paste()
-            self.logger.info("Clipboard access test successful")
-            
-        except Exception as e:
-            self.logger.error(f"Clipboard access test failed: {e}")
-            raise
-    
     def _print_status(self):
         if self.auto_paste:
             method_name = "key simulation (CTRL+V)"
-            self.logger.info(f"Auto-paste is ENABLED using {method_name}", extra={'user_message': True})
+            self.logger.info("Auto-paste is ENABLED using %s", method_name, extra={'user_message': True})
         else:
             self.logger.info("Auto-paste is DISABLED - paste manually with Ctrl+V", extra={'user_message': True})
     
@@ -37,12 +80,12 @@ class ClipboardManager:
             return False
         
         try:
-            self.logger.info(f"Copying text to clipboard ({len(text)} chars)")
+            self.logger.info("Copying text to clipboard (%d chars)", len(text))
             pyperclip.copy(text)
             return True
                 
         except Exception as e:
-            self.logger.error(f"Failed to copy text to clipboard: {e}")
+            self.logger.error("Failed to copy text to clipboard: %s", e)
             return False
     
     def get_clipboard_content(self) -> Optional[str]:
@@ -55,7 +98,7 @@ class ClipboardManager:
                 return None
                 
         except Exception as e:
-            self.logger.error(f"Failed to paste text from clipboard: {e}")
+            self.logger.error("Failed to paste text from clipboard: %s", e)
             return None
     
     def copy_with_notification(self, text: str) -> bool:
@@ -76,55 +119,107 @@ class ClipboardManager:
             return True
             
         except Exception as e:
-            self.logger.error(f"Failed to clear clipboard: {e}")
+            self.logger.error("Failed to clear clipboard: %s", e)
             return False
     
     def get_active_window_handle(self) -> Optional[int]:
         try:
             hwnd = win32gui.GetForegroundWindow()
             if hwnd:
-                window_title = win32gui.GetWindowText(hwnd)
-                self.logger.info(f"Active window: '{window_title}' (handle: {hwnd})")
+                if self.logger.isEnabledFor(logging.INFO):
+                    self.logger.info("Active window: '%s' (handle: %s)", win32gui.GetWindowText(hwnd), hwnd)
                 return hwnd
             else:
                 return None
         except Exception as e:
-            self.logger.error(f"Failed to get active window handle: {e}")
+            self.logger.error("Failed to get active window handle: %s", e)
             return None       
     
     def execute_auto_paste(self, text: str, preserve_clipboard: bool) -> bool:              
         try:
-            original_content = None
-            if preserve_clipboard:
-                original_content = pyperclip.paste()
-
-            if not self.copy_text(text):
+            if not text:
                 return False
-            time.sleep(max(0.02, self.key_simulation_delay))
 
+            # Read once, before anything is written: a failed Win32 write may already
+            # have emptied the clipboard, so it must not be re-read in the fallback
+            original_content = self._read_clipboard_text() if preserve_clipboard else None
             try:
-                hwnd = win32gui.GetForegroundWindow()
-                if hwnd:
-                    self.logger.debug(f"Auto-paste target window: '{win32gui.GetWindowText(hwnd)}' ({hwnd})")
-            except Exception:
-                pass
+                self.logger.info("Copying text to clipboard (%d chars)", len(text))
+                self._set_clipboard_text(text)
+            except Exception as e:
+                self.logger.debug("Win32 clipboard write failed, falling back to pyperclip: %s", e)
+                # Clipboard write shares the outer try; copy_text is kept for external callers
+                pyperclip.copy(text)
+            time.sleep(max(0.02, self.key_simulation_delay))
+
+            if self.logger.isEnabledFor(logging.DEBUG):
+                try:
+                    hwnd = win32gui.GetForegroundWindow()
+                    if hwnd:
+                        self.logger.debug("Auto-paste target window: '%s' (%s)", win32gui.GetWindowText(hwnd), hwnd)
+                except Exception:
+                    pass
 
             self._send_ctrl_v()
             self.logger.info("Auto-pasted via Win32 key simulation", extra={'user_message': True})
 
             if original_content is not None:
                 restore_delay = max(0.15, self.key_simulation_delay * 3)
-                self.logger.debug(f"Waiting {restore_delay:.3f}s before restoring original clipboard content")
+                self.logger.debug("Waiting %.3fs before restoring original clipboard content", restore_delay)
                 time.sleep(restore_delay)
-                pyperclip.copy(original_content)
+                self._restore_clipboard_text(original_content)
                 time.sleep(self.key_simulation_delay)
 
             return True
             
         except Exception as e:
-            self.logger.error(f"Failed to simulate paste keypress: {e}")
+            self.logger.error("Failed to simulate paste keypress: %s", e)
             return False
         
+    def _open_clipboard(self, attempts: int = 5):
+        # Another process may hold the clipboard briefly; retry before giving up
+        for attempt in range(attempts):
+            try:
+                win32clipboard.OpenClipboard()
+                return
+            except Exception:
+                if attempt == attempts - 1:
+                    raise
+                time.sleep(0.01)
+
+    def _read_clipboard_text(self) -> str:
+        """Current unicode clipboard text ("" if none), via Win32 with a pyperclip fallback."""
+        try:
+            self._open_clipboard()
+            try:
+                if win32clipboard.IsClipboardFormatAvailable(win32con.CF_UNICODETEXT):
+                    return win32clipboard.GetClipboardData(win32con.CF_UNICODETEXT)
+                return ""
+            finally:
+                win32clipboard.CloseClipboard()
+        except Exception as e:
+            self.logger.debug("Win32 clipboard read failed, falling back to pyperclip: %s", e)
+            return pyperclip.paste()
+
+    def _set_clipboard_text(self, text: str):
+        """Put text on the clipboard in a single Open/CloseClipboard cycle.
+
+        Raises on failure so the caller can fall back to pyperclip.
+        """
+        self._open_clipboard()
+        try:
+            win32clipboard.EmptyClipboard()
+            win32clipboard.SetClipboardData(win32con.CF_UNICODETEXT, text)
+        finally:
+            win32clipboard.CloseClipboard()
+
+    def _restore_clipboard_text(self, text: str):
+        try:
+            self._set_clipboard_text(text)
+        except Exception as e:
+            self.logger.debug("Win32 clipboard restore failed, falling back to pyperclip: %s", e)
+            pyperclip.copy(text)
+
     def send_enter_key(self) -> bool:
         try:
             self.logger.info("Sending ENTER key to active application")
@@ -134,7 +229,7 @@ class ClipboardManager:
             return True
             
         except Exception as e:
-            self.logger.error(f"Failed to send ENTER key: {e}")
+            self.logger.error("Failed to send ENTER key: %s", e)
             return False
 
     def deliver_transcription(self,
@@ -160,43 +255,41 @@ class ClipboardManager:
             return success
 
         except Exception as e:
-            self.logger.error(f"Delivery workflow failed: {e}")
+            self.logger.error("Delivery workflow failed: %s", e)
             return False
         
     def update_auto_paste(self, enabled: bool):
         self.auto_paste = enabled
         self._print_status()
 
-    def _key_down(self, vk_code: int):
-        try:
-            win32api.keybd_event(vk_code, 0, 0, 0)
-        except Exception as e:
-            self.logger.error(f"key_down failed for vk={vk_code}: {e}")
+    @staticmethod
+    def _build_key_inputs(events: Sequence[Tuple[int, bool]]):
+        """Build an INPUT array from (vk_code, is_key_up) pairs."""
+        inputs = (INPUT * len(events))()
+        keyup = win32con.KEYEVENTF_KEYUP
+        for i, (vk_code, key_up) in enumerate(events):
+            inputs[i].type = INPUT_KEYBOARD
+            inputs[i].u.ki.wVk = vk_code
+            inputs[i].u.ki.dwFlags = keyup if key_up else 0
+        return inputs
 
-    def _key_up(self, vk_code: int):
-        try:
-            win32api.keybd_event(vk_code, 0, win32con.KEYEVENTF_KEYUP, 0)
-        except Exception as e:
-            self.logger.error(f"key_up failed for vk={vk_code}: {e}")
+    def _send_keys(self, inputs):
+        """Inject a prebuilt INPUT array with one SendInput call, order preserved."""
+        count = len(inputs)
+        sent = self._send_input(count, inputs, self._input_size)
+        if sent != count:
+            raise ctypes.WinError(ctypes.get_last_error())
 
     def _send_ctrl_v(self):
         try:
-            self._key_down(win32con.VK_CONTROL)
-            time.sleep(0.01)
-            self._key_down(ord('V'))
-            time.sleep(0.01)
-            self._key_up(ord('V'))
-            time.sleep(0.005)
-            self._key_up(win32con.VK_CONTROL)
+            self._send_keys(self._ctrl_v_inputs)
             time.sleep(max(0.02, self.key_simulation_delay))
         except Exception as e:
-            self.logger.error(f"Failed to send Ctrl+V: {e}")
+            self.logger.error("Failed to send Ctrl+V: %s", e)
 
     def _send_enter(self):
         try:
-            self._key_down(win32con.VK_RETURN)
-            time.sleep(0.01)
-            self._key_up(win32con.VK_RETURN)
+            self._send_keys(self._enter_inputs)
             time.sleep(max(0.02, self.key_simulation_delay))
         except Exception as e:
-            self.logger.error(f"Failed to send ENTER: {e}")
+            self.logger.error("Failed to send ENTER: %s", e)
\ No newline at end of file
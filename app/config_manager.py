@@ -1,8 +1,13 @@
+import copy
+import io
 import logging
+import os
+import pickle
 import sys
+import tempfile
 from pathlib import Path
-from typing import Any, Dict
-from ruamel.yaml import YAML
+from types import MappingProxyType
+from typing import Any, Dict, Mapping
 
 DEFAULT_CONFIG: Dict[str, Any] = {
     "whisper": {
@@ -10,6 +15,7 @@ DEFAULT_CONFIG: Dict[str, Any] = {
         "model": "Systran/faster-distil-whisper-base",
         "language": "auto",
         "beam_size": 5,
+        "silence_threshold": 0.005, # Peak amplitude below which a clip is not sent
         "local_url": "http://localhost:10300",
         "external_url": "http://remote-host:10300",
     },
@@ -52,14 +58,31 @@ DEFAULT_CONFIG: Dict[str, Any] = {
 
 
 class ConfigManager:
+    __slots__ = (
+        "logger",
+        "_yaml_load",
+        "_yaml_dump",
+        "base_dir",
+        "config_path",
+        "cache_path",
+        "config",
+        "_views",
+    )
+
     def __init__(self, config_filename: str = "config.yaml"):
         self.logger = logging.getLogger(__name__)
-        self.yaml = YAML()
+        # ruamel.yaml is imported on first use: a safe loader (libyaml-backed
+        # when available) for the read path, a round-trip dumper for writes.
+        self._yaml_load = None
+        self._yaml_dump = None
         self.base_dir = self._resolve_base_dir()
         self.config_path = self.base_dir / config_filename
+        self.cache_path = self.config_path.with_name(config_filename + ".cache")
         self.config: Dict[str, Any] = {}
+        self._views: Dict[str, Mapping[str, Any]] = {}
         self._load_or_create()
-        self.logger.info(f"Configuration loaded: {self.config_path}")
+        self._rebuild_views()
+        self.logger.info("Configuration loaded: %s", self.config_path)
 
     def _resolve_base_dir(self) -> Path:
         if getattr(sys, 'frozen', False):  # PyInstaller frozen
@@ -73,49 +96,131 @@ class ConfigManager:
                 return p
         return cwd
 
+    def _get_yaml_loader(self):
+        if self._yaml_load is None:
+            from ruamel.yaml import YAML
+            try:
+                self._yaml_load = YAML(typ='safe', pure=False)
+            except ImportError:
+                self._yaml_load = YAML(typ='safe', pure=True)
+        return self._yaml_load
+
+    def _get_yaml_dumper(self):
+        if self._yaml_dump is None:
+            from ruamel.yaml import YAML
+            self._yaml_dump = YAML()
+        return self._yaml_dump
+
     def _load_or_create(self):
         path = self.config_path
-        if not path.exists():
-            self.logger.warning("config.yaml not found, creating with defaults")
-            self.config = DEFAULT_CONFIG.copy()
-            self._write_config_file()
-            return
         try:
-            with open(path, "r", encoding="utf-8") as f:
-                data = self.yaml.load(f) or {}
+            # Single open instead of exists()+open(); bytes go straight to the parser
+            with open(path, "rb") as f:
+                st = os.fstat(f.fileno())
+                key = (st.st_mtime_ns, st.st_size)
+                data = self._read_parse_cache(key)
+                if data is None:
+                    data = self._get_yaml_loader().load(f) or {}
+                    self._write_parse_cache(key, data)
             self.config = self._fill_defaults(data, DEFAULT_CONFIG)
             self._migrate_legacy_whisper_section()
+        except FileNotFoundError:
+            self.logger.warning("config.yaml not found, creating with defaults")
+            self.config = copy.deepcopy(DEFAULT_CONFIG)
+            self._write_config_file()
         except Exception as e:
-            self.logger.error(f"Failed to load config.yaml: {e}. Recreating defaults.")
-            self.config = DEFAULT_CONFIG.copy()
+            self.logger.error("Failed to load config.yaml: %s. Recreating defaults.", e)
+            self.config = copy.deepcopy(DEFAULT_CONFIG)
             self._write_config_file()
 
+    # --- Parsed YAML snapshot keyed on (mtime_ns, size) of config.yaml ---
+    def _read_parse_cache(self, key):
+        try:
+            with open(self.cache_path, "rb") as f:
+                cached_key, data = pickle.load(f)
+        except Exception:
+            return None
+        if cached_key != key or not isinstance(data, dict):
+            return None
+        self.logger.debug("Using cached parse of config.yaml")
+        return data
+
+    def _write_parse_cache(self, key, data: Dict[str, Any]):
+        tmp_name = None
+        try:
+            with tempfile.NamedTemporaryFile(
+                dir=self.base_dir, prefix=".config-cache-", delete=False
+            ) as tf:
+                tmp_name = tf.name
+                pickle.dump((key, data), tf, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_name, self.cache_path)
+        except Exception as e:
+            self.logger.debug("Failed to write config cache: %s", e)
+            if tmp_name:
+                try:
+                    os.unlink(tmp_name)
+                except OSError:
+                    pass
+
+    def _invalidate_parse_cache(self):
+        try:
+            os.unlink(self.cache_path)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            self.logger.debug("Failed to remove config cache: %s", e)
+
     def _fill_defaults(
         self, current: Dict[str, Any], defaults: Dict[str, Any]
     ) -> Dict[str, Any]:
         result: Dict[str, Any] = {}
-        for k, dv in defaults.items():
-            cv = current.get(k)
-            if isinstance(dv, dict):
-                if isinstance(cv, dict):
-                    result[k] = self._fill_defaults(cv, dv)
+        # Iterative merge: each frame fills one nested section
+        stack = [(result, current, defaults)]
+        while stack:
+            res, cur, dfl = stack.pop()
+            for k, dv in dfl.items():
+                cv = cur.get(k)
+                if type(dv) is dict:
+                    if isinstance(cv, dict):
+                        child: Dict[str, Any] = {}
+                        res[k] = child
+                        stack.append((child, cv, dv))
+                    else:
+                        # Never alias DEFAULT_CONFIG subtrees into the live config
+                        res[k] = copy.deepcopy(dv)
                 else:
-                    result[k] = dv
-            else:
-                result[k] = dv if cv is None else cv
-        # Keep extra keys from current (do not prune)
-        for extra_k, extra_v in current.items():
-            if extra_k not in result:
-                result[extra_k] = extra_v
+                    res[k] = dv if cv is None else cv
+            # Keep extra keys from current (do not prune)
+            res.update({k: v for k, v in cur.items() if k not in res})
         return result
 
     def _write_config_file(self):
+        tmp_name = None
         try:
-            with open(self.config_path, "w", encoding="utf-8") as f:
-                self.yaml.dump(self.config, f)
-            self.logger.info(f"Saved configuration to {self.config_path}")
+            buf = io.StringIO()
+            self._get_yaml_dumper().dump(self.config, buf)
+            payload = buf.getvalue().encode("utf-8")
+            # Write to a sibling temp file and swap it in, so an interrupted
+            # write never leaves a truncated config.yaml behind
+            with tempfile.NamedTemporaryFile(
+                dir=self.config_path.parent, prefix=".config-", suffix=".tmp", delete=False
+            ) as tf:
+                tmp_name = tf.name
+                tf.write(payload)
+                tf.flush()
+                os.fsync(tf.fileno())
+            os.replace(tmp_name, self.config_path)
+            tmp_name = None
+            self._invalidate_parse_cache()
+            self.logger.info("Saved configuration to %s", self.config_path)
         except Exception as e:
-            self.logger.error(f"Error writing configuration: {e}")
+            self.logger.error("Error writing configuration: %s", e)
+        finally:
+            if tmp_name:
+                try:
+                    os.unlink(tmp_name)
+                except OSError:
+                    pass
 
     # --- Migration from legacy schema (model_size / whisper_model / whisper_url) ---
     def _migrate_legacy_whisper_section(self, write_if_changed: bool = False):
@@ -134,9 +239,6 @@ class ConfigManager:
             if isinstance(candidate, str) and candidate:
                 wh["model"] = canonical_for(candidate)
                 changed = True
-        if "model" not in wh:
-            wh["model"] = DEFAULT_CONFIG["whisper"]["model"]
-            changed = True
         # backend mode determination
         if legacy_url:
             # If user changed url from default local one -> treat as external
@@ -149,52 +251,65 @@ class ConfigManager:
                 wh["backend_mode"] = "local"
                 wh["local_url"] = legacy_url
                 changed = True
-        # Ensure required keys exist
-        for k in ("backend_mode", "local_url", "external_url", "beam_size", "language"):
-            if k not in wh:
-                wh[k] = DEFAULT_CONFIG["whisper"][k]
-                changed = True
+        # Ensure required keys exist (current values win over defaults)
+        defaults_view = DEFAULT_CONFIG["whisper"]
+        if defaults_view.keys() - wh.keys():
+            wh = {**defaults_view, **wh}
+            changed = True
         if changed:
             self.config["whisper"] = wh
             self.logger.info("Migrated legacy whisper config -> new schema")
             if write_if_changed:
                 self._write_config_file()
 
-    # --- Public accessors (return live copies) ---
+    # --- Read-only section views (rebuilt only when a section dict is replaced) ---
+    def _rebuild_views(self):
+        self._views = {
+            s: MappingProxyType(v) for s, v in self.config.items() if isinstance(v, dict)
+        }
+
+    def _section_view(self, section: str) -> Mapping[str, Any]:
+        view = self._views.get(section)
+        if view is None:
+            return MappingProxyType({})
+        return view
+
+    # --- Public accessors ---
     def get_setting(self, section: str, key: str):
         return self.config.get(section, {}).get(key)
 
     def update_user_setting(self, section: str, key: str, value: Any):
         if section not in self.config or not isinstance(self.config[section], dict):
             self.config[section] = {}
+            self._views[section] = MappingProxyType(self.config[section])
         old = self.config[section].get(key)
         if old == value:
             return
         self.config[section][key] = value
         self._write_config_file()
-        self.logger.info(f"Updated setting {section}.{key}: {old} -> {value}")
+        self.logger.info("Updated setting %s.%s: %s -> %s", section, key, old, value)
 
-    # For backward compatibility with existing code expecting dict copies
-    def get_whisper_config(self) -> Dict[str, Any]:
-        return self.config.get("whisper", {}).copy()
+    # Section getters return live read-only views; use dict(...) for a writable copy
+    def get_whisper_config(self) -> Mapping[str, Any]:
+        return self._section_view("whisper")
 
-    def get_hotkey_config(self) -> Dict[str, Any]:
-        return self.config.get("hotkey", {}).copy()
+    def get_hotkey_config(self) -> Mapping[str, Any]:
+        return self._section_view("hotkey")
 
-    def get_audio_config(self) -> Dict[str, Any]:
-        return self.config.get("audio", {}).copy()
+    def get_audio_config(self) -> Mapping[str, Any]:
+        return self._section_view("audio")
 
-    def get_clipboard_config(self) -> Dict[str, Any]:
-        return self.config.get("clipboard", {}).copy()
+    def get_clipboard_config(self) -> Mapping[str, Any]:
+        return self._section_view("clipboard")
 
-    def get_logging_config(self) -> Dict[str, Any]:
-        return self.config.get("logging", {}).copy()
+    def get_logging_config(self) -> Mapping[str, Any]:
+        return self._section_view("logging")
 
-    def get_system_tray_config(self) -> Dict[str, Any]:
-        return self.config.get("system_tray", {}).copy()
+    def get_system_tray_config(self) -> Mapping[str, Any]:
+        return self._section_view("system_tray")
 
-    def get_audio_feedback_config(self) -> Dict[str, Any]:
-        return self.config.get("audio_feedback", {}).copy()
+    def get_audio_feedback_config(self) -> Mapping[str, Any]:
+        return self._section_view("audio_feedback")
 
     # Deprecated method kept for minimal surface compatibility (no-op now)
     def print_stop_instructions_based_on_config(self):
@@ -17,18 +17,95 @@ Currently we do not automatically configure GPU. If GPU usage is required, start
 """
 from __future__ import annotations
 
+import functools
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Dict
 
 logger = logging.getLogger(__name__)
 
-try:
-    import docker  # type: ignore
-    from docker.errors import DockerException, NotFound  # type: ignore
-except Exception:  # pragma: no cover - import guard
-    docker = None  # type: ignore
-    DockerException = Exception  # type: ignore
-    NotFound = Exception  # type: ignore
+# How long a container inspect result is reused by the info getters (seconds)
+INSPECT_CACHE_TTL = 1.0
+# How long a ping result is trusted by is_available() (seconds)
+AVAILABILITY_CACHE_TTL = 1.0
+
+# The docker SDK is imported on first use (see _docker()), so processes that
+# never touch the backend don't pay for it. Until then the error names are
+# broad placeholders; _docker() rebinds them to the real SDK classes.
+docker = None  # type: ignore
+DockerException = Exception  # type: ignore
+ImageNotFound = Exception  # type: ignore
+NotFound = Exception  # type: ignore
+_docker_import_failed = False
+
+
+def _docker():
+    """Return the docker module, importing it on first call (None if unavailable)."""
+    global docker, DockerException, ImageNotFound, NotFound, _docker_import_failed
+    if docker is None and not _docker_import_failed:
+        try:
+            import docker as _d  # type: ignore
+            from docker.errors import DockerException as _de, ImageNotFound as _inf, NotFound as _nf  # type: ignore
+        except Exception:  # pragma: no cover - import guard
+            _docker_import_failed = True
+            return None
+        DockerException, ImageNotFound, NotFound = _de, _inf, _nf
+        docker = _d
+    return docker
+
+# Container create settings shared by first start and recreation (mirror
+# docker-compose.yml). The SDK only reads these, so the same objects are reused.
+# Named volume for model cache similar to compose (auto created if absent)
+_VOLUMES = {"models_cache": {"bind": "/config", "mode": "rw"}}
+# GPU support for faster-whisper; count -1 means all available GPUs
+_DEVICE_REQUESTS = [{"driver": "nvidia", "capabilities": [["gpu"]], "count": -1}]
+_RESTART_POLICY = {"Name": "unless-stopped"}
+
+# One Docker SDK client shared by every manager in the process. It is created
+# lazily, and dropped after a failed ping so the next call reconnects.
+DOCKER_MAX_POOL_SIZE = 20
+_shared_client = None
+_shared_client_lock = threading.Lock()
+
+
+def _get_shared_client():
+    global _shared_client
+    sdk = _docker()
+    if sdk is None:
+        return None
+    with _shared_client_lock:
+        if _shared_client is None:
+            try:
+                _shared_client = sdk.from_env(max_pool_size=DOCKER_MAX_POOL_SIZE)
+            except Exception as e:  # pragma: no cover
+                logger.debug(f"Failed to init docker client: {e}")
+                return None
+        return _shared_client
+
+
+def _reset_shared_client(client) -> None:
+    global _shared_client
+    with _shared_client_lock:
+        if _shared_client is not client:
+            return
+        _shared_client = None
+    try:
+        client.close()
+    except Exception:
+        pass
+
+
+def _invalidates_inspect_cache(method):
+    """Drop the cached inspect result once a lifecycle operation has run."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            self._invalidate_inspect_cache()
+    return wrapper
 
 
 class DockerBackendManager:
@@ -52,30 +129,41 @@ class DockerBackendManager:
             "WHISPER_LANG": "ru",
         }
         self.auto_pull = auto_pull
-        self._client = None
+        self._default_ports = {f"{port}/tcp": port}
+        # (container or None, attrs or None, monotonic timestamp)
+        self._inspect_cache = None
+        # Config.Env of the cached inspect, parsed into a dict once per inspect
+        self._env_cache: Dict[str, str] = {}
+        # Host port bindings of the cached inspect ({} when none / no container)
+        self._ports_cache: Dict[str, str] = {}
+        # Last ping result; _avail_ts = 0 forces a fresh ping
+        self._avail_ts: float = 0.0
+        self._avail_ok: bool = False
 
     # --- internal helpers ---
     def _client_or_none(self):
-        if docker is None:
-            return None
-        if self._client is None:
-            try:
-                self._client = docker.from_env()
-            except Exception as e:  # pragma: no cover
-                logger.debug(f"Failed to init docker client: {e}")
-                return None
-        return self._client
+        return _get_shared_client()
 
     def is_available(self) -> bool:
+        now = time.monotonic()
+        if now - self._avail_ts < AVAILABILITY_CACHE_TTL:
+            return self._avail_ok
         cli = self._client_or_none()
-        if cli is None:
-            return False
-        try:
-            cli.ping()
-            return True
-        except Exception as e:
-            logger.debug(f"Docker ping failed: {e}")
-            return False
+        ok = False
+        if cli is not None:
+            try:
+                cli.ping()
+                ok = True
+            except Exception as e:
+                logger.debug(f"Docker ping failed: {e}")
+                _reset_shared_client(cli)
+        self._avail_ok = ok
+        self._avail_ts = now
+        return ok
+
+    def _forget_availability(self) -> None:
+        """Force the next is_available() to ping again (after a failed Docker call)."""
+        self._avail_ts = 0.0
 
     # --- core container operations ---
     def _get_container(self):
@@ -90,13 +178,157 @@ class DockerBackendManager:
             logger.debug(f"Error getting container {self.container_name}: {e}")
             return None
 
+    def _find_container(self):
+        """Look the container up without raising when it does not exist.
+
+        containers.list() returns [] for a missing container, whereas get() makes
+        the SDK build and raise NotFound. The name filter is a substring match,
+        so the sparse hits are narrowed to the exact '/name' before the full get().
+        """
+        cli = self._client_or_none()
+        if cli is None:
+            return None
+        try:
+            hits = cli.containers.list(
+                all=True, filters={"name": self.container_name}, sparse=True
+            )
+        except Exception as e:
+            logger.debug(f"Error listing containers, falling back to get: {e}")
+            return self._get_container()
+        wanted = "/" + self.container_name
+        for hit in hits:
+            if wanted in (hit.attrs.get("Names") or ()):
+                try:
+                    return cli.containers.get(hit.id)
+                except NotFound:  # removed between list and get
+                    return None
+                except Exception as e:  # pragma: no cover
+                    logger.debug(f"Error getting container {self.container_name}: {e}")
+                    return None
+        return None
+
+    def _inspect_cached(self, max_age: float = INSPECT_CACHE_TTL):
+        """Return (container, attrs), reusing a recent inspect instead of hitting the daemon.
+
+        _find_container() returns a freshly inspected object, so no reload()
+        is needed on a cache miss. A missing container is cached as (None, None) too.
+        """
+        now = time.monotonic()
+        cached = self._inspect_cache
+        if cached is not None and now - cached[2] < max_age:
+            return cached[0], cached[1]
+        container = self._find_container()
+        attrs = container.attrs if container is not None else None
+        self._inspect_cache = (container, attrs, now)
+        self._env_cache = self._parse_env(attrs)
+        self._ports_cache = self._preserve_ports(attrs)
+        return container, attrs
+
+    @staticmethod
+    def _parse_env(attrs) -> Dict[str, str]:
+        if not attrs:
+            return {}
+        env_vars = (attrs.get('Config') or {}).get('Env') or ()
+        return dict(e.split('=', 1) for e in env_vars if '=' in e)
+
+    @staticmethod
+    def _preserve_ports(attrs) -> Dict[str, str]:
+        """Map container port -> first host port from the inspect's port bindings."""
+        if not attrs:
+            return {}
+        pb = (attrs.get('NetworkSettings') or {}).get('Ports') or {}
+        return {cp: hc[0]['HostPort'] for cp, hc in pb.items() if hc}
+
+    def _invalidate_inspect_cache(self):
+        self._inspect_cache = None
+        self._env_cache = {}
+        self._ports_cache = {}
+
+    def _env_matches(self, overrides: Dict[str, str]) -> bool:
+        """True if every override already equals the cached container Env value."""
+        self._inspect_cached()
+        env = self._env_cache
+        return all(env.get(k) == str(v) for k, v in overrides.items())
+
+    def _running_env(self) -> Optional[Dict[str, str]]:
+        """Env dict of the running container (from the inspect cache), else None."""
+        container, _ = self._inspect_cached()
+        if container is not None and container.status == 'running':
+            return self._env_cache
+        return None
+
+    def _ensure_image(self, cli) -> None:
+        """Pull the image only when it is not present locally (and auto_pull is on)."""
+        if not self.auto_pull:
+            return
+        try:
+            cli.images.get(self.image)
+            return
+        except ImageNotFound:
+            pass
+        except Exception as e:
+            logger.debug(f"Image lookup warning: {e}")
+        try:
+            logger.info(f"Pulling image {self.image}...")
+            cli.images.pull(self.image)
+        except Exception as e:
+            logger.debug(f"Image pull warning: {e}")
+
+    def _create_container(self, cli, env: Dict[str, str], ports: Dict):
+        """Create (not start) the backend container with the shared create settings."""
+        return cli.containers.create(
+            self.image,
+            name=self.container_name,
+            detach=True,
+            environment=env,
+            ports=ports,
+            volumes=_VOLUMES,
+            restart_policy=_RESTART_POLICY,
+            device_requests=_DEVICE_REQUESTS,
+        )
+
+    def _wait_running(self, container, timeout: float = 5.0) -> bool:
+        """Reload until the container reports 'running' or timeout elapses.
+
+        Backs off from 50 ms so a fast start returns almost immediately instead
+        of always paying a fixed sleep."""
+        deadline = time.monotonic() + timeout
+        delay = 0.05
+        while True:
+            container.reload()
+            if container.status == "running":
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, 0.8)
+
+    def _is_running(self) -> bool:
+        """Running check via the container list endpoint (no full inspect payload)."""
+        cli = self._client_or_none()
+        if cli is None:
+            return False
+        try:
+            hits = cli.containers.list(
+                filters={"name": self.container_name, "status": "running"}, sparse=True
+            )
+        except Exception as e:
+            logger.debug(f"Error listing running containers: {e}")
+            return False
+        # The name filter is a substring match; sparse entries carry '/name' in Names
+        wanted = "/" + self.container_name
+        return any(wanted in (c.attrs.get("Names") or ()) for c in hits)
+
     def status(self) -> str:
         if not self.is_available():
             return "error"
-        c = self._get_container()
+        if self._is_running():
+            return "running"
+        # Not running: a full inspect tells stopped/not_found/other apart
+        c = self._find_container()
         if c is None:
             return "not_found"
-        c.reload()
         st = getattr(c, "status", "unknown")
         if st == "running":
             return "running"
@@ -104,6 +336,7 @@ class DockerBackendManager:
             return "stopped"
         return st or "error"
 
+    @_invalidates_inspect_cache
     def start(self) -> str:
         """Start backend container. Creates container if missing.
         Returns resulting status string (see module docstring)."""
@@ -114,63 +347,39 @@ class DockerBackendManager:
         if cli is None:
             return "error"
 
-        container = self._get_container()
+        if self._is_running():
+            return "running"
+
+        container = self._find_container()
         if container is not None:
-            container.reload()
-            if container.status == "running":
-                return "running"
             try:
                 container.start()
                 container.reload()
                 return "running" if container.status == "running" else "stopped"
             except DockerException as e:
+                self._forget_availability()
                 logger.error(f"Failed to start container: {e}")
                 return "error"
 
         # Need to create new container
         try:
-            if self.auto_pull:
-                try:
-                    logger.info(f"Pulling image {self.image} (if not present)...")
-                    cli.images.pull(self.image)
-                except Exception as e:
-                    logger.debug(f"Image pull warning: {e}")
+            self._ensure_image(cli)
             logger.info("Creating faster-whisper container (first run)...")
-            ports = {f"{self.port}/tcp": self.port}
-            # Named volume for model cache similar to compose (auto created if absent)
-            volumes = {"models_cache": {"bind": "/config", "mode": "rw"}}
-            
-            # GPU support for faster-whisper
-            device_requests = [
-                {
-                    "driver": "nvidia",
-                    "capabilities": [["gpu"]],
-                    "count": -1  # -1 means all available GPUs
-                }
-            ]
-            
-            container = cli.containers.create(
-                self.image,
-                name=self.container_name,
-                detach=True,
-                environment=self.default_env,
-                ports=ports,
-                volumes=volumes,
-                restart_policy={"Name": "unless-stopped"},
-                device_requests=device_requests,
-            )
+            container = self._create_container(cli, self.default_env, self._default_ports)
             container.start()
             container.reload()
             logger.info("Container created and started.")
             return "running" if container.status == "running" else "stopped"
         except DockerException as e:
+            self._forget_availability()
             logger.error(f"Failed to create/start container: {e}")
             return "error"
 
+    @_invalidates_inspect_cache
     def stop(self) -> str:
         if not self.is_available():
             return "error"
-        container = self._get_container()
+        container = self._find_container()
         if container is None:
             return "not_found"
         try:
@@ -180,13 +389,15 @@ class DockerBackendManager:
             container.reload()
             return "stopped" if container.status != "running" else "running"
         except DockerException as e:
+            self._forget_availability()
             logger.error(f"Failed to stop container: {e}")
             return "error"
 
+    @_invalidates_inspect_cache
     def remove(self, force: bool = False) -> str:
         if not self.is_available():
             return "error"
-        container = self._get_container()
+        container = self._find_container()
         if container is None:
             return "not_found"
         try:
@@ -195,49 +406,47 @@ class DockerBackendManager:
             container.remove(force=force)
             return "not_found"
         except DockerException as e:
+            self._forget_availability()
             logger.error(f"Failed to remove container: {e}")
             return "error"
 
-    def restart_with_model(self, model_alias: str) -> str:
-        """Restart container with a new WHISPER_MODEL.
-        This requires creating a new container because faster-whisper 
-        loads model at startup via environment variable.
-        
-        Args:
-            model_alias: Model alias (e.g., 'turbo') to use in container environment
-        
+    @_invalidates_inspect_cache
+    def _restart_with_env(self, overrides: Dict[str, str], description: str) -> str:
+        """Recreate the container with `overrides` applied on top of default_env.
+
+        faster-whisper reads WHISPER_* at startup, so changing them requires a new
+        container. A single inspect decides whether the overrides are already active.
         Returns resulting status string."""
         if not self.is_available():
-            logger.warning("Docker daemon not available – cannot restart with new model")
+            logger.warning(f"Docker daemon not available – cannot restart with {description}")
             return "error"
         
-        # Check if model is already set (avoid unnecessary restart)
-        current_model = self.get_container_model_info()
-        if current_model == model_alias:
-            container = self._get_container()
-            if container and container.status == "running":
-                logger.info(f"Model alias '{model_alias}' already active in container")
-                return "running"
+        # Check if all overrides are already set (avoid unnecessary restart)
+        container, _ = self._inspect_cached()
+        if container is not None and container.status == "running" and self._env_matches(overrides):
+            logger.info(f"{description[0].upper()}{description[1:]} already active in container")
+            return "running"
         
-        logger.info(f"Recreating container with model alias '{model_alias}'")
+        logger.info(f"Recreating container with {description}")
+        
+        cli = self._client_or_none()
+        if cli is None:
+            return "error"
+        
+        # The image check/pull does not depend on the old container, so run it
+        # while the (blocking) stop is in progress instead of after it
+        image_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="docker-image")
+        image_ready = image_pool.submit(self._ensure_image, cli)
+        image_pool.shutdown(wait=False)
         
-        # Update default environment with new model alias
         updated_env = self.default_env.copy()
-        updated_env["WHISPER_MODEL"] = model_alias
+        updated_env.update(overrides)
         
-        # Get existing container to preserve settings
-        container = self._get_container()
-        existing_ports = None
+        # Preserve existing port configuration (parsed with the inspect above)
+        ports = self._ports_cache or self._default_ports
         
         if container is not None:
             try:
-                # Preserve existing port configuration
-                port_bindings = container.attrs.get('NetworkSettings', {}).get('Ports', {})
-                existing_ports = {}
-                for container_port, host_configs in port_bindings.items():
-                    if host_configs:
-                        existing_ports[container_port] = host_configs[0]['HostPort']
-                
                 # Stop and remove existing container
                 if container.status == "running":
                     logger.info("Stopping existing container...")
@@ -246,54 +455,66 @@ class DockerBackendManager:
                 container.remove()
                 
             except DockerException as e:
-                logger.error(f"Failed to stop/remove container for model switch: {e}")
+                self._forget_availability()
+                logger.error(f"Failed to stop/remove container for switch to {description}: {e}")
                 return "error"
         
-        # Create and start new container with updated model
-        cli = self._client_or_none()
-        if cli is None:
-            return "error"
-        
+        # Create and start new container with updated environment
         try:
-            logger.info(f"Creating new container with model alias '{model_alias}'...")
+            image_ready.result()
+            logger.info(f"Creating new container with {description}...")
             
-            # Use preserved or default settings
-            ports = existing_ports if existing_ports else {f"{self.port}/tcp": self.port}
-            volumes = {"models_cache": {"bind": "/config", "mode": "rw"}}
-            
-            # GPU support for faster-whisper
-            device_requests = [
-                {
-                    "driver": "nvidia",
-                    "capabilities": [["gpu"]],
-                    "count": -1  # -1 means all available GPUs
-                }
-            ]
-            
-            container = cli.containers.create(
-                self.image,
-                name=self.container_name,
-                detach=True,
-                environment=updated_env,
-                ports=ports,
-                volumes=volumes,
-                restart_policy={"Name": "unless-stopped"},
-                device_requests=device_requests,
-            )
+            container = self._create_container(cli, updated_env, ports)
             container.start()
-            container.reload()
-            
-            # Wait a moment for container to initialize
-            import time
-            time.sleep(2)
+            self._wait_running(container)
             
-            logger.info(f"Container recreated successfully with model alias '{model_alias}'.")
+            logger.info(f"Container recreated successfully with {description}.")
             return "running" if container.status == "running" else "stopped"
             
         except DockerException as e:
-            logger.error(f"Failed to create container with model alias '{model_alias}': {e}")
+            self._forget_availability()
+            logger.error(f"Failed to create container with {description}: {e}")
             return "error"
 
+    def restart_with_model(self, model_alias: str) -> str:
+        """Restart container with a new WHISPER_MODEL.
+
+        Args:
+            model_alias: Model alias (e.g., 'turbo') to use in container environment
+        
+        Returns resulting status string."""
+        return self._restart_with_env(
+            {"WHISPER_MODEL": model_alias},
+            f"model alias '{model_alias}'",
+        )
+
+    def restart_with_model_and_beam(self, model_alias: str, beam_size: int) -> str:
+        """Restart container with a new WHISPER_MODEL and WHISPER_BEAM.
+
+        Args:
+            model_alias: Model alias (e.g., 'turbo') to use in container environment
+            beam_size: Beam size value to use in container environment
+        
+        Returns resulting status string."""
+        return self._restart_with_env(
+            {"WHISPER_MODEL": model_alias, "WHISPER_BEAM": str(beam_size)},
+            f"model alias '{model_alias}' and beam size {beam_size}",
+        )
+
+    def restart_with_model_beam_and_lang(self, model_alias: str, beam_size: int, language: str) -> str:
+        """Restart container with a new WHISPER_MODEL, WHISPER_BEAM, and WHISPER_LANG.
+
+        Args:
+            model_alias: Model alias (e.g., 'turbo') to use in container environment
+            beam_size: Beam size value to use in container environment
+            language: Language code (e.g., 'ru', 'en') to use in container environment
+        
+        Returns resulting status string."""
+        return self._restart_with_env(
+            {"WHISPER_MODEL": model_alias, "WHISPER_BEAM": str(beam_size), "WHISPER_LANG": language},
+            f"model alias '{model_alias}', beam size {beam_size}, and language '{language}'",
+        )
+
     # Convenience wrapper used by UI (returns tuple)
     def get_health_and_status(self, health_checker) -> tuple[str, bool]:
         """Return (status, health_ok) where:
@@ -318,18 +539,9 @@ class DockerBackendManager:
         """
         # First try to get model from container environment variables (most reliable)
         try:
-            container = self._get_container()
-            if container:
-                # Check if container is running
-                container.reload()
-                if container.status == 'running':
-                    # Get environment variables from container
-                    env_vars = container.attrs.get('Config', {}).get('Env', [])
-                    for env in env_vars:
-                        if env.startswith('WHISPER_MODEL='):
-                            model_env = env.split('=', 1)[1]
-                            return model_env
-                            
+            env = self._running_env()
+            if env is not None and 'WHISPER_MODEL' in env:
+                return env['WHISPER_MODEL']
         except Exception as e:
             logger.debug(f"Failed to get container model info: {e}")
         
@@ -349,21 +561,12 @@ class DockerBackendManager:
         Returns beam size if available, None if unavailable.
         """
         try:
-            container = self._get_container()
-            if container:
-                # Check if container is running
-                container.reload()
-                if container.status == 'running':
-                    # Get environment variables from container
-                    env_vars = container.attrs.get('Config', {}).get('Env', [])
-                    for env in env_vars:
-                        if env.startswith('WHISPER_BEAM='):
-                            beam_env = env.split('=', 1)[1]
-                            try:
-                                return int(beam_env)
-                            except ValueError:
-                                return None
-                            
+            env = self._running_env()
+            if env is not None and (beam_env := env.get('WHISPER_BEAM')):
+                try:
+                    return int(beam_env)
+                except ValueError:
+                    return None
         except Exception as e:
             logger.debug(f"Failed to get container beam info: {e}")
         
@@ -374,220 +577,10 @@ class DockerBackendManager:
         Returns language if available, None if unavailable.
         """
         try:
-            container = self._get_container()
-            if container:
-                # Check if container is running
-                container.reload()
-                if container.status == 'running':
-                    # Get environment variables from container
-                    env_vars = container.attrs.get('Config', {}).get('Env', [])
-                    for env in env_vars:
-                        if env.startswith('WHISPER_LANG='):
-                            lang_env = env.split('=', 1)[1]
-                            return lang_env
-                            
+            env = self._running_env()
+            if env is not None:
+                return env.get('WHISPER_LANG')
         except Exception as e:
             logger.debug(f"Failed to get container lang info: {e}")
         
         return None
-
-    def restart_with_model_and_beam(self, model_alias: str, beam_size: int) -> str:
-        """Restart container with a new WHISPER_MODEL and WHISPER_BEAM.
-        This requires creating a new container because faster-whisper 
-        loads configuration at startup via environment variables.
-        
-        Args:
-            model_alias: Model alias (e.g., 'turbo') to use in container environment
-            beam_size: Beam size value to use in container environment
-        
-        Returns resulting status string."""
-        if not self.is_available():
-            logger.warning("Docker daemon not available – cannot restart with new model and beam")
-            return "error"
-        
-        # Check if both model and beam are already set (avoid unnecessary restart)
-        current_model = self.get_container_model_info()
-        current_beam = self.get_container_beam_info()
-        if current_model == model_alias and current_beam == beam_size:
-            container = self._get_container()
-            if container and container.status == "running":
-                logger.info(f"Model alias '{model_alias}' and beam size {beam_size} already active in container")
-                return "running"
-        
-        logger.info(f"Recreating container with model alias '{model_alias}' and beam size {beam_size}")
-        
-        # Update default environment with new model alias and beam size
-        updated_env = self.default_env.copy()
-        updated_env["WHISPER_MODEL"] = model_alias
-        updated_env["WHISPER_BEAM"] = str(beam_size)
-        
-        # Get existing container to preserve settings
-        container = self._get_container()
-        existing_ports = None
-        
-        if container is not None:
-            try:
-                # Preserve existing port configuration
-                port_bindings = container.attrs.get('NetworkSettings', {}).get('Ports', {})
-                existing_ports = {}
-                for container_port, host_configs in port_bindings.items():
-                    if host_configs:
-                        existing_ports[container_port] = host_configs[0]['HostPort']
-                
-                # Stop and remove existing container
-                if container.status == "running":
-                    logger.info("Stopping existing container...")
-                    container.stop(timeout=5)  # Reduced timeout for faster restart
-                logger.info("Removing existing container...")
-                container.remove()
-                
-            except DockerException as e:
-                logger.error(f"Failed to stop/remove container for model/beam switch: {e}")
-                return "error"
-        
-        # Create and start new container with updated model and beam
-        cli = self._client_or_none()
-        if cli is None:
-            return "error"
-        
-        try:
-            logger.info(f"Creating new container with model alias '{model_alias}' and beam size {beam_size}...")
-            
-            # Use preserved or default settings
-            ports = existing_ports if existing_ports else {f"{self.port}/tcp": self.port}
-            volumes = {"models_cache": {"bind": "/config", "mode": "rw"}}
-            
-            # GPU support for faster-whisper
-            device_requests = [
-                {
-                    "driver": "nvidia",
-                    "capabilities": [["gpu"]],
-                    "count": -1  # -1 means all available GPUs
-                }
-            ]
-            
-            container = cli.containers.create(
-                self.image,
-                name=self.container_name,
-                detach=True,
-                environment=updated_env,
-                ports=ports,
-                volumes=volumes,
-                restart_policy={"Name": "unless-stopped"},
-                device_requests=device_requests,
-            )
-            container.start()
-            container.reload()
-            
-            # Wait a moment for container to initialize
-            import time
-            time.sleep(2)
-            
-            logger.info(f"Container recreated successfully with model alias '{model_alias}' and beam size {beam_size}.")
-            return "running" if container.status == "running" else "stopped"
-            
-        except DockerException as e:
-            logger.error(f"Failed to create container with model alias '{model_alias}' and beam size {beam_size}: {e}")
-            return "error"
-
-    def restart_with_model_beam_and_lang(self, model_alias: str, beam_size: int, language: str) -> str:
-        """Restart container with a new WHISPER_MODEL, WHISPER_BEAM, and WHISPER_LANG.
-        This requires creating a new container because faster-whisper 
-        loads configuration at startup via environment variables.
-        
-        Args:
-            model_alias: Model alias (e.g., 'turbo') to use in container environment
-            beam_size: Beam size value to use in container environment
-            language: Language code (e.g., 'ru', 'en') to use in container environment
-        
-        Returns resulting status string."""
-        if not self.is_available():
-            logger.warning("Docker daemon not available – cannot restart with new model, beam, and language")
-            return "error"
-        
-        # Check if all parameters are already set (avoid unnecessary restart)
-        current_model = self.get_container_model_info()
-        current_beam = self.get_container_beam_info()
-        current_lang = self.get_container_lang_info()
-        if current_model == model_alias and current_beam == beam_size and current_lang == language:
-            container = self._get_container()
-            if container and container.status == "running":
-                logger.info(f"Model alias '{model_alias}', beam size {beam_size}, and language '{language}' already active in container")
-                return "running"
-        
-        logger.info(f"Recreating container with model alias '{model_alias}', beam size {beam_size}, and language '{language}'")
-        
-        # Update default environment with new model alias, beam size, and language
-        updated_env = self.default_env.copy()
-        updated_env["WHISPER_MODEL"] = model_alias
-        updated_env["WHISPER_BEAM"] = str(beam_size)
-        updated_env["WHISPER_LANG"] = language
-        
-        # Get existing container to preserve settings
-        container = self._get_container()
-        existing_ports = None
-        
-        if container is not None:
-            try:
-                # Preserve existing port configuration
-                port_bindings = container.attrs.get('NetworkSettings', {}).get('Ports', {})
-                existing_ports = {}
-                for container_port, host_configs in port_bindings.items():
-                    if host_configs:
-                        existing_ports[container_port] = host_configs[0]['HostPort']
-                
-                # Stop and remove existing container
-                if container.status == "running":
-                    logger.info("Stopping existing container...")
-                    container.stop(timeout=5)  # Reduced timeout for faster restart
-                logger.info("Removing existing container...")
-                container.remove()
-                
-            except DockerException as e:
-                logger.error(f"Failed to stop/remove container for model/beam/lang switch: {e}")
-                return "error"
-        
-        # Create and start new container with updated model, beam, and language
-        cli = self._client_or_none()
-        if cli is None:
-            return "error"
-        
-        try:
-            logger.info(f"Creating new container with model alias '{model_alias}', beam size {beam_size}, and language '{language}'...")
-            
-            # Use preserved or default settings
-            ports = existing_ports if existing_ports else {f"{self.port}/tcp": self.port}
-            volumes = {"models_cache": {"bind": "/config", "mode": "rw"}}
-            
-            # GPU support for faster-whisper
-            device_requests = [
-                {
-                    "driver": "nvidia",
-                    "capabilities": [["gpu"]],
-                    "count": -1  # -1 means all available GPUs
-                }
-            ]
-            
-            container = cli.containers.create(
-                self.image,
-                name=self.container_name,
-                detach=True,
-                environment=updated_env,
-                ports=ports,
-                volumes=volumes,
-                restart_policy={"Name": "unless-stopped"},
-                device_requests=device_requests,
-            )
-            container.start()
-            container.reload()
-            
-            # Wait a moment for container to initialize
-            import time
-            time.sleep(2)
-            
-            logger.info(f"Container recreated successfully with model alias '{model_alias}', beam size {beam_size}, and language '{language}'.")
-            return "running" if container.status == "running" else "stopped"
-            
-        except DockerException as e:
-            logger.error(f"Failed to create container with model alias '{model_alias}', beam size {beam_size}, and language '{language}': {e}")
-            return "error"
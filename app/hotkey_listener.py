@@ -1,4 +1,9 @@
+import functools
 import logging
+import operator
+import queue
+import threading
+from types import MappingProxyType
 
 from global_hotkeys import register_hotkeys, start_checking_hotkeys, stop_checking_hotkeys
 # Extra imports to encourage PyInstaller to collect dependencies used internally
@@ -13,6 +18,45 @@ except Exception:
 
 from app.state_manager import StateManager
 
+# Config key names -> global_hotkeys key names (anything else passes through).
+# Read-only: _format_hotkey memoizes on it, so it must never change at runtime.
+_KEY_MAPPING = MappingProxyType({
+    'ctrl': 'control',
+    'shift': 'shift',
+    'alt': 'alt',
+    'win': 'window',
+    'windows': 'window',
+    'cmd': 'window',
+    'super': 'window',
+    'space': 'space',
+    'enter': 'enter',
+    'esc': 'escape'
+})
+
+
+@functools.lru_cache(maxsize=64)
+def _format_hotkey(hotkey_str: str) -> str:
+    """'Ctrl+Shift+Space' -> 'control + shift + space'. Pure, so memoized: the same
+    few combinations are converted again on every rebind."""
+    keys = hotkey_str.lower().split('+')
+    converted_keys = []
+    for key in keys:
+        key = key.strip()
+        converted_keys.append(_KEY_MAPPING.get(key, key))
+    return ' + '.join(converted_keys)
+
+class _EventChannel:
+    """Queue and bookkeeping owned by one worker thread, so a retiring worker
+    never touches the state of its replacement."""
+    __slots__ = ('queue', 'pending', 'busy', 'lock')
+
+    def __init__(self, busy: bool = False):
+        self.queue: queue.SimpleQueue = queue.SimpleQueue()
+        self.pending: set = set()  # Ops queued but not started
+        self.busy = busy  # A handler (e.g. stop -> transcription) is running
+        self.lock = threading.Lock()
+
+
 class HotkeyListener:
     def __init__(self, state_manager: StateManager, start_recording_hotkey: str,
                  stop_recording_hotkey: str | None = None,
@@ -29,6 +73,11 @@ class HotkeyListener:
         self.stop_recording_hotkey = stop_recording_hotkey
         self.cancel_combination = cancel_combination
         self.is_listening = False
+        # Hotkey callbacks only enqueue; a worker thread runs the state transitions
+        # so the global_hotkeys polling thread never blocks on the state manager
+        self._channel: _EventChannel | None = None
+        self._event_worker: threading.Thread | None = None
+        self._retired_worker: threading.Thread | None = None  # May still be inside a handler
         self.logger = logging.getLogger(__name__)
         self.logger.debug(f"[hotkeys] Initializing (frozen={getattr(__import__('sys'),'frozen',False)}) start='{start_recording_hotkey}' stop='{stop_recording_hotkey}' cancel='{cancel_combination}'")
 
@@ -47,27 +96,32 @@ class HotkeyListener:
             hotkey_configs.append({
                 'combination': self.start_recording_hotkey,
                 'callback': self._toggle_hotkey_pressed,
-                'name': 'toggle'
+                'name': 'toggle',
+                'specificity': self.start_recording_hotkey.count('+') + 1
             })
         else:
             hotkey_configs.append({
                 'combination': self.start_recording_hotkey,
                 'callback': self._start_hotkey_pressed,
-                'name': 'start'
+                'name': 'start',
+                'specificity': self.start_recording_hotkey.count('+') + 1
             })
             if self.stop_recording_hotkey:
                 hotkey_configs.append({
                     'combination': self.stop_recording_hotkey,
                     'callback': self._stop_hotkey_pressed,
-                    'name': 'stop'
+                    'name': 'stop',
+                    'specificity': self.stop_recording_hotkey.count('+') + 1
                 })
         if self.cancel_combination and not same_toggle:
             hotkey_configs.append({
                 'combination': self.cancel_combination,
                 'callback': self._cancel_hotkey_pressed,
-                'name': 'cancel'
+                'name': 'cancel',
+                'specificity': self.cancel_combination.count('+') + 1
             })
-        hotkey_configs.sort(key=self._get_hotkey_combination_specificity, reverse=True)
+        # Combos with more keys take priority
+        hotkey_configs.sort(key=operator.itemgetter('specificity'), reverse=True)
         self.hotkey_bindings = []
         for config in hotkey_configs:
             formatted_hotkey = self._convert_hotkey_to_global_hotkeys_format(config['combination'])
@@ -80,28 +134,94 @@ class HotkeyListener:
             self.logger.info(f"Configured {config['name']} hotkey: {config['combination']} -> {formatted_hotkey}")
         self.logger.info(f"Total hotkeys configured: {len(self.hotkey_bindings)}")
     
-    def _get_hotkey_combination_specificity(self, hotkey_config: dict) -> int:
-        """
-        Returns specificity score to ensure combos with more keys take priority
-        """
-        combination = hotkey_config['combination'].lower()
-        return len(combination.split('+'))
-    
     def _start_hotkey_pressed(self):
+        self._dispatch(self._handle_start)
+
+    def _stop_hotkey_pressed(self):
+        self._dispatch(self._handle_stop)
+
+    def _toggle_hotkey_pressed(self):
+        self._dispatch(self._handle_toggle)
+
+    def _cancel_hotkey_pressed(self):
+        self._dispatch(self._handle_cancel)
+
+    def _dispatch(self, op):
+        """Queue `op` for the worker.
+
+        A press whose op is still queued is dropped, and so is any press made
+        while a handler is running (or while the previous worker finishes one):
+        replaying it afterwards could start a recording nobody asked for once a
+        transcription finishes."""
+        channel = self._channel
+        if channel is None:
+            return
+        with channel.lock:
+            if channel.busy or op in channel.pending:
+                return
+            channel.pending.add(op)
+        channel.queue.put_nowait(op)
+
+    def _event_loop(self, channel: _EventChannel, previous: threading.Thread | None):
+        if previous is not None:
+            # Hand over: the state manager is only ever called from one worker at a
+            # time, so wait out a handler the previous worker is still running
+            # (presses meanwhile are dropped, the channel starts busy)
+            previous.join()
+            with channel.lock:
+                channel.busy = False
+        while True:
+            op = channel.queue.get()
+            if op is None:
+                return
+            with channel.lock:
+                channel.pending.discard(op)
+                channel.busy = True
+            try:
+                op()
+            except Exception as e:
+                self.logger.error(f"Hotkey handler failed: {e}")
+            finally:
+                with channel.lock:
+                    channel.busy = False
+
+    def _start_event_worker(self):
+        if self._event_worker is not None and self._event_worker.is_alive():
+            return
+        previous = self._retired_worker
+        if previous is not None and not previous.is_alive():
+            previous = None
+        self._retired_worker = None
+        # A fresh channel per worker, so a stopping worker never races a new one
+        self._channel = _EventChannel(busy=previous is not None)
+        self._event_worker = threading.Thread(
+            target=self._event_loop, args=(self._channel, previous), name="hotkey-events", daemon=True
+        )
+        self._event_worker.start()
+
+    def _stop_event_worker(self):
+        channel = self._channel
+        self._channel = None
+        self._retired_worker = self._event_worker
+        self._event_worker = None
+        if channel is not None:
+            channel.queue.put_nowait(None)  # Already queued presses still run first
+
+    def _handle_start(self):
         self.logger.info(f"Start hotkey pressed: {self.start_recording_hotkey}")
         if self.state_manager.get_current_state() == "idle":
             self.state_manager.toggle_recording()
         else:
             self.logger.debug("Start hotkey ignored - not idle")
 
-    def _stop_hotkey_pressed(self):
+    def _handle_stop(self):
         self.logger.info(f"Stop hotkey pressed: {self.stop_recording_hotkey}")
         if self.state_manager.get_current_state() == "recording":
             self.state_manager.stop_recording(use_auto_enter=False)
         else:
             self.logger.debug("Stop hotkey ignored - not recording")
 
-    def _toggle_hotkey_pressed(self):
+    def _handle_toggle(self):
         # Unified toggle when start == stop
         current = self.state_manager.get_current_state()
         if current == "idle":
@@ -113,7 +233,7 @@ class HotkeyListener:
         else:
             self.logger.debug("Toggle hotkey ignored - busy state")
     
-    def _cancel_hotkey_pressed(self):
+    def _handle_cancel(self):
         self.logger.info(f"Cancel hotkey pressed: {self.cancel_combination}")
         self.state_manager.cancel_recording_hotkey_pressed()
     
@@ -122,11 +242,13 @@ class HotkeyListener:
             return
         try:
             self.logger.debug(f"[hotkeys] Registering {len(self.hotkey_bindings)} bindings: {self.hotkey_bindings}")
+            self._start_event_worker()
             register_hotkeys(self.hotkey_bindings)
             start_checking_hotkeys()
             self.is_listening = True
             self.logger.info("Global hotkey listener active")
         except Exception as e:
+            self._stop_event_worker()
             self.logger.error(f"Failed to start hotkey listener: {e}")
             raise
     
@@ -143,30 +265,14 @@ class HotkeyListener:
             except (ImportError, AttributeError):
                 # Если функция clear_hotkeys недоступна, используем альтернативный подход
                 self.logger.debug("clear_hotkeys not available, using alternative cleanup")
+            self._stop_event_worker()
             self.is_listening = False
             self.logger.info("Hotkey listener stopped")
         except Exception as e:
             self.logger.error(f"Error stopping hotkey listener: {e}")
     
     def _convert_hotkey_to_global_hotkeys_format(self, hotkey_str: str) -> str:
-        key_mapping = {
-            'ctrl': 'control',
-            'shift': 'shift',
-            'alt': 'alt',
-            'win': 'window',
-            'windows': 'window',
-            'cmd': 'window',
-            'super': 'window',
-            'space': 'space',
-            'enter': 'enter',
-            'esc': 'escape'
-        }
-        keys = hotkey_str.lower().split('+')
-        converted_keys = []
-        for key in keys:
-            key = key.strip()
-            converted_keys.append(key_mapping.get(key, key))
-        return ' + '.join(converted_keys)    
+        return _format_hotkey(hotkey_str)
     
     def change_hotkey_config(self, setting: str, value):
         valid_settings = ['start_recording_hotkey', 'stop_recording_hotkey', 'cancel_combination']
@@ -1,20 +1,47 @@
+import ctypes
 import logging
 import sys
 import time
 
-import win32api
-import win32event
-
 logger = logging.getLogger(__name__)
 
+ERROR_ALREADY_EXISTS = 183
+
+_kernel32 = ctypes.WinDLL('kernel32', use_last_error=True)
+_kernel32.CreateMutexW.restype = ctypes.c_void_p
+_kernel32.CreateMutexW.argtypes = [ctypes.c_void_p, ctypes.c_int, ctypes.c_wchar_p]
+_kernel32.CloseHandle.restype = ctypes.c_int
+_kernel32.CloseHandle.argtypes = [ctypes.c_void_p]
+
+
+class _MutexHandle:
+    """Owns a raw mutex HANDLE and closes it when released (like pywin32's PyHANDLE)."""
+
+    def __init__(self, handle: int):
+        self.handle = handle
+
+    def close(self):
+        if self.handle:
+            _kernel32.CloseHandle(self.handle)
+            self.handle = None
+
+    def __del__(self):
+        self.close()
+
+
 def guard_against_multiple_instances(app_name: str = "LazyToTextLocal"):
     mutex_name = f"{app_name}_SingleInstance"
     
     try:
-        mutex_handle = win32event.CreateMutex(None, True, mutex_name)
+        raw_handle = _kernel32.CreateMutexW(None, True, mutex_name)
+        last_error = ctypes.get_last_error()
+        if not raw_handle:
+            raise ctypes.WinError(last_error)
+        mutex_handle = _MutexHandle(raw_handle)
         
-        if win32api.GetLastError() == 183:  # ERROR_ALREADY_EXISTS
+        if last_error == ERROR_ALREADY_EXISTS:
             logger.info("Another instance detected")
+            mutex_handle.close()
             _exit_to_prevent_duplicate()
         else:
             logger.info("Primary instance acquired mutex")
@@ -28,9 +55,7 @@ def guard_against_multiple_instances(app_name: str = "LazyToTextLocal"):
 def _exit_to_prevent_duplicate():
     logger.info("Lazy to text is already running!", extra={'user_message': True})       
     logger.info("This app will close in 3 seconds...", extra={'user_message': True})
-    
-    for i in range(3, 0, -1):
-        time.sleep(1)
+    time.sleep(3)
     
     logger.info("Goodbye!", extra={'user_message': True})
     sys.exit(0)
\ No newline at end of file
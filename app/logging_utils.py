@@ -1,9 +1,16 @@
 import logging
-import os
+from collections import deque
 from logging.handlers import RotatingFileHandler
-from typing import List
+from typing import Deque
 
-from app.utils import get_project_logs_path
+from app.utils import project_logs_dir
+
+_LEVELS = logging.getLevelNamesMapping()
+
+
+def _exclude_user_messages(record: logging.LogRecord) -> bool:
+    """Handler filter dropping records tagged with extra={'user_message': True}."""
+    return not getattr(record, 'user_message', False)
 
 
 class EarlyBufferHandler(logging.Handler):
@@ -15,14 +22,12 @@ class EarlyBufferHandler(logging.Handler):
 
     def __init__(self, level=logging.DEBUG, max_records: int = 1000):
         super().__init__(level=level)
-        self.records: List[logging.LogRecord] = []
+        # Bounded: once full, the oldest records are dropped on append
+        self.records: Deque[logging.LogRecord] = deque(maxlen=max_records)
         self.max_records = max_records
 
     def emit(self, record: logging.LogRecord):
         self.records.append(record)
-        if len(self.records) > self.max_records:
-            # Keep only the last max_records
-            self.records = self.records[-self.max_records:]
 
     def replay_to(self, target_logger: logging.Logger):
         """Replay buffered records through target_logger (usually root)."""
@@ -40,6 +45,8 @@ def setup_logging(config_manager):
     to decouple UI from main (CLI removed).
     """
     log_config = config_manager.get_logging_config()
+    file_cfg = log_config['file']
+    console_cfg = log_config['console']
 
     root_logger = logging.getLogger()
     root_logger.setLevel(logging.DEBUG)  # Lowest level; handlers will filter
@@ -48,11 +55,10 @@ def setup_logging(config_manager):
 
     formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
 
-    if log_config['file']['enabled']:
-        logs_dir = get_project_logs_path()
-        log_file_path = os.path.join(logs_dir, log_config['file']['filename'])
+    if file_cfg['enabled']:
+        log_file_path = project_logs_dir() / file_cfg['filename']
 
-        rotation_cfg = log_config['file'].get('rotation', {})
+        rotation_cfg = file_cfg.get('rotation', {})
         use_rotation = rotation_cfg.get('enabled', False)
 
         if use_rotation:
@@ -68,24 +74,21 @@ def setup_logging(config_manager):
         else:
             file_handler = logging.FileHandler(log_file_path, encoding='utf-8')
 
-        file_handler.setLevel(getattr(logging, log_config['level']))
+        file_handler.setLevel(_LEVELS[log_config['level']])
         file_handler.setFormatter(formatter)
         root_logger.addHandler(file_handler)
         root_logger.info(f"Logging to file: {log_file_path} (rotation={'on' if use_rotation else 'off'})")
 
-    if log_config['console']['enabled']:
+    if console_cfg['enabled']:
         console_handler = logging.StreamHandler()
-        console_level = log_config['console'].get('level', 'WARNING')
-        console_handler.setLevel(getattr(logging, console_level))
+        console_level = console_cfg.get('level', 'WARNING')
+        console_handler.setLevel(_LEVELS[console_level])
         console_handler.setFormatter(formatter)
 
         user_cfg = log_config.get('user_messages', {})
         include_user = user_cfg.get('console_include', False)
         if not include_user:
-            class ExcludeUserMessages(logging.Filter):
-                def filter(self, record: logging.LogRecord) -> bool:
-                    return not getattr(record, 'user_message', False)
-            console_handler.addFilter(ExcludeUserMessages())
+            console_handler.addFilter(_exclude_user_messages)
 
         root_logger.addHandler(console_handler)
 
@@ -4,14 +4,17 @@ We keep a single source of truth for mapping between short aliases presented to
 and canonical model identifiers expected by the backend.
 
 Public helpers:
-- ALIAS_TO_MODEL: dict alias->canonical
-- MODEL_TO_ALIAS: reverse map (first alias wins)
+- ALIAS_TO_MODEL: read-only mapping alias->canonical
+- MODEL_TO_ALIAS: read-only reverse map (first alias wins)
 - canonical_for(x): returns canonical model id for alias or canonical if already canonical
 - alias_for(canonical): returns preferred alias for canonical, or canonical if unknown
 """
 from __future__ import annotations
 
-ALIAS_TO_MODEL = {
+import functools
+from types import MappingProxyType
+
+_ALIAS_TO_MODEL = {
     # "tiny.en": "Systran/faster-whisper-tiny.en",
     # "tiny": "Systran/faster-whisper-tiny",
     # "base.en": "Systran/faster-whisper-base.en",
@@ -33,14 +36,21 @@ ALIAS_TO_MODEL = {
     "turbo": "mobiuslabsgmbh/faster-whisper-large-v3-turbo",
 }
 
-MODEL_TO_ALIAS = {}
-for a, c in ALIAS_TO_MODEL.items():  # first alias wins if duplicates
-    MODEL_TO_ALIAS.setdefault(c, a)
+_MODEL_TO_ALIAS = {}
+for a, c in _ALIAS_TO_MODEL.items():  # first alias wins if duplicates
+    _MODEL_TO_ALIAS.setdefault(c, a)
+
+# Frozen views: the tables never change at runtime, which also keeps the
+# memoized lookups below valid
+ALIAS_TO_MODEL = MappingProxyType(_ALIAS_TO_MODEL)
+MODEL_TO_ALIAS = MappingProxyType(_MODEL_TO_ALIAS)
 
 
+@functools.lru_cache(maxsize=32)
 def canonical_for(name: str) -> str:
     return ALIAS_TO_MODEL.get(name, name)
 
 
+@functools.lru_cache(maxsize=32)
 def alias_for(canonical: str) -> str:
     return MODEL_TO_ALIAS.get(canonical, canonical)
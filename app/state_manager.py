@@ -31,7 +31,9 @@ class StateManager:
         self.is_model_loading = False
         self.last_transcription = None
         self._pending_model_change = None  # Store pending model change request
-        self._state_lock = threading.Lock()  # Thread safety for state operations
+        # Guards state writes only; the query methods read the flags without it
+        # (single attribute loads are atomic, and toggle_recording re-checks)
+        self._state_lock = threading.RLock()
 
         self.logger = logging.getLogger(__name__)
     
@@ -66,19 +68,21 @@ class StateManager:
             return False
     
     def toggle_recording(self):
-        was_recording = self.stop_recording(use_auto_enter=False)
+        # One snapshot drives the decision instead of re-querying the recorder per check
+        with self._state_lock:
+            recording = self.audio_recorder.get_recording_status()
+            processing = self.is_processing
+            loading = self.is_model_loading
         
-        if not was_recording:
-            current_state = self.get_current_state()
-            if self.can_start_recording():
-                self._start_recording()
-            else:
-                if self.is_processing:
-                    self.logger.info("Still processing previous recording...", extra={'user_message': True})
-                elif self.is_model_loading:
-                    self.logger.info("Still loading model...", extra={'user_message': True})
-                else:
-                    self.logger.info(f"Cannot record while {current_state}...", extra={'user_message': True})
+        if recording:
+            audio_data = self.audio_recorder.stop_recording()
+            self._transcription_pipeline(audio_data, use_auto_enter=False)
+        elif processing:
+            self.logger.info("Still processing previous recording...", extra={'user_message': True})
+        elif loading:
+            self.logger.info("Still loading model...", extra={'user_message': True})
+        else:
+            self._start_recording()
 
     def _start_recording(self):
         success = self.audio_recorder.start_recording()
@@ -89,12 +93,13 @@ class StateManager:
             self.system_tray.update_state("recording")
     
     def _transcription_pipeline(self, audio_data, use_auto_enter: bool = False):
+        pending_model = None
         try:
-            self.logger.debug("[Pipeline] Enter _transcription_pipeline (auto_enter=%s)" % use_auto_enter)
+            self.logger.debug("[Pipeline] Enter _transcription_pipeline (auto_enter=%s)", use_auto_enter)
             # Prevent multiple threads from starting simultaneous transcription
             with self._state_lock:
                 self.is_processing = True
-                self.logger.debug(f"[Pipeline] is_processing set True; model_loading={self.is_model_loading}")
+                self.logger.debug("[Pipeline] is_processing set True; model_loading=%s", self.is_model_loading)
 
             self.audio_feedback.play_stop_sound()
             
@@ -104,22 +109,23 @@ class StateManager:
             
             duration = self.audio_recorder.get_audio_duration(audio_data)
             self.logger.info(f"Recorded {duration:.1f} seconds! Transcribing...", extra={'user_message': True})
-            self.logger.debug(f"[Pipeline] Recorded duration={duration:.3f}s; starting transcription")
+            self.logger.debug("[Pipeline] Recorded duration=%.3fs; starting transcription", duration)
             
             transcribed_text = self.whisper_engine.transcribe_audio(audio_data)
-            self.logger.debug(f"[Pipeline] transcribe_audio returned length={0 if not transcribed_text else len(transcribed_text)}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("[Pipeline] transcribe_audio returned length=%d", len(transcribed_text) if transcribed_text else 0)
             
             if not transcribed_text:
                 self.logger.debug("[Pipeline] No transcription text -> return path")
                 return
             
             self.system_tray.update_state("processing")
-            self.logger.debug("[Pipeline] System tray set to processing; delivering transcription (auto_enter=%s)" % use_auto_enter)
+            self.logger.debug("[Pipeline] System tray set to processing; delivering transcription (auto_enter=%s)", use_auto_enter)
 
             success = self.clipboard_manager.deliver_transcription(
                 transcribed_text, use_auto_enter
             )
-            self.logger.debug(f"[Pipeline] deliver_transcription success={success}")
+            self.logger.debug("[Pipeline] deliver_transcription success=%s", success)
             
             if success:
                 self.last_transcription = transcribed_text
@@ -133,16 +139,17 @@ class StateManager:
             self.logger.debug("[Pipeline] Enter finally block")
             with self._state_lock:
                 self.is_processing = False
-                self.logger.debug(f"[Pipeline] is_processing set False; model_loading={self.is_model_loading}")
+                self.logger.debug("[Pipeline] is_processing set False; model_loading=%s", self.is_model_loading)
                 
                 pending_model = self._pending_model_change                    
             
             # Execute pending model change outside of lock to avoid deadlock
-            if 'pending_model' in locals() and pending_model:
+            if pending_model:
                 self.logger.info(f"Executing pending model change to: {pending_model}")
                 self.logger.info(f"Processing complete, now switching to {pending_model} model...", extra={'user_message': True})
                 self._execute_model_change(pending_model)
-                self._pending_model_change = None
+                with self._state_lock:
+                    self._pending_model_change = None
             else:
                 self.system_tray.update_state("idle")
                 self.logger.debug("[Pipeline] System tray set to idle; pipeline end")
@@ -192,19 +199,17 @@ class StateManager:
                     self.system_tray.update_state("idle")
     
     def can_start_recording(self) -> bool:
-        with self._state_lock:
-            return not (self.is_processing or self.is_model_loading or self.audio_recorder.get_recording_status())
+        return not (self.is_processing or self.is_model_loading or self.audio_recorder.get_recording_status())
     
     def get_current_state(self) -> str:
-        with self._state_lock:
-            if self.is_model_loading:
-                return "model_loading"
-            elif self.is_processing:
-                return "processing"
-            elif self.audio_recorder.get_recording_status():
-                return "recording"
-            else:
-                return "idle"
+        if self.is_model_loading:
+            return "model_loading"
+        elif self.is_processing:
+            return "processing"
+        elif self.audio_recorder.get_recording_status():
+            return "recording"
+        else:
+            return "idle"
     
     def request_model_change(self, new_model_size: str) -> bool:
         current_state = self.get_current_state()
@@ -224,7 +229,8 @@ class StateManager:
         
         if current_state == "processing":
             self.logger.info(f"Queueing model change to {new_model_size} until transcription completes...", extra={'user_message': True})
-            self._pending_model_change = new_model_size
+            with self._state_lock:
+                self._pending_model_change = new_model_size
             return True
         
         if current_state == "idle":
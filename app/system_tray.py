@@ -1,9 +1,10 @@
+import functools
 import logging
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, TYPE_CHECKING
-from pathlib import Path
 
-from app.utils import resolve_asset_path
+from app.utils import asset_path
 
 try:
     import pystray
@@ -14,11 +15,46 @@ except ImportError:
     pystray = None
     Image = None
 
+# Whether the platform backend supports a default (double-click) menu action
+_HAS_DEFAULT = getattr(pystray.Icon, 'HAS_DEFAULT', True) if TRAY_AVAILABLE else True
+
+# Menu refresh requests arriving within this window (seconds) are merged
+REFRESH_DELAY = 0.03
+
+_FALLBACK_COLORS = {
+    'idle': (128, 128, 128),      # Gray
+    'recording': (34, 139, 34),   # Green
+    'processing': (255, 165, 0)   # Orange
+}
+
+
+# 16x16 opaque gray RGBA pixels shared by every fallback icon
+_GRAY_BUF = b'\x80\x80\x80\xff' * 256
+
+
+@functools.lru_cache(maxsize=8)
+def _make_fallback(state: str):
+    """Plain 16x16 square used when a state's icon file is missing (one per state).
+
+    The gray image wraps _GRAY_BUF without copying; colored states paste their
+    color over it, which makes PIL copy the buffer for that one image."""
+    icon = Image.frombuffer('RGBA', (16, 16), _GRAY_BUF, 'raw', 'RGBA', 0, 1)
+    color = _FALLBACK_COLORS.get(state, (128, 128, 128))  # Default to gray
+    if color != (128, 128, 128):
+        icon.paste(color + (255,), (0, 0, 16, 16))
+    return icon
+
 if TYPE_CHECKING:
     from app.state_manager import StateManager
     from app.config_manager import ConfigManager
 
 class SystemTray:
+    _ICON_FILES = (
+        ("idle", "assets/tray_idle.png"),
+        ("recording", "assets/tray_recording.png"),
+        ("processing", "assets/tray_processing.png"),
+    )
+
     def __init__(self,
                  state_manager: Optional['StateManager'],
                  tray_config: dict = None,
@@ -35,14 +71,22 @@ class SystemTray:
         self.config_manager = config_manager
         self.show_window_callback = show_window_callback
         self.is_window_visible_callback = is_window_visible_callback
+        # Pushed by the UI via notify_window_visibility(); seeded once here
+        self._window_visible = bool(is_window_visible_callback()) if is_window_visible_callback else False
         self.logger = logging.getLogger(__name__)
 
         self.icon = None  # pystray Icon
         self.is_running = False
         self.current_state = "idle"
-        self.thread = None
         self.available = True
-        self.icons = {}
+        self.icons = {}  # state -> Image, filled on demand by _get_icon()
+        self._icon_paths = {}  # state -> resolved icon file Path
+        self._last_icon_obj = None  # Image currently shown by the tray icon
+        self._menu = None  # Built once; item labels are re-read by icon.update_menu()
+        self._pending_refresh = False
+        # Single worker for off-callback tray work (stopping on exit)
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tray")
+        self._refresh_lock = threading.Lock()
         self._quit_callback = None  # Ability to notify UI of exit intent
         self._quit_flag = False
 
@@ -52,12 +96,6 @@ class SystemTray:
     def attach_state_manager(self, state_manager: 'StateManager'):
         """Late binding of StateManager (if initially None)."""
         self.state_manager = state_manager
-        # Attach updated menu if icon already started
-        if self.is_running and self.icon:
-            try:
-                self.icon.menu = self._create_menu()
-            except Exception as e:
-                self.logger.error(f"Failed to rebuild tray menu after attaching state manager: {e}")
     
     def _check_tray_availability(self) -> bool:
         if not self.tray_config.get('enabled', True):
@@ -67,50 +105,55 @@ class SystemTray:
             self.logger.warning("[tray] pystray or Pillow not installed -> tray unavailable")
             self.available = False
         else:
-            self.logger.debug(f"[tray] pystray backend available (TRAY_AVAILABLE={TRAY_AVAILABLE})")
+            self.logger.debug("[tray] pystray backend available (TRAY_AVAILABLE=%s)", TRAY_AVAILABLE)
         return self.available
     
     def _load_icons_to_cache(self):
+        """Resolve the per-state icon paths. The PNGs are opened on first use by
+        _get_icon(), so startup does not pay for icons that are never shown."""
         try:
             self.icons = {}
-            
-            icon_files = {
-                "idle": "assets/tray_idle.png",
-                "recording": "assets/tray_recording.png",
-                "processing": "assets/tray_processing.png"
-            }
-            
-            for state, asset_path in icon_files.items():
-                icon_path = Path(resolve_asset_path(asset_path))
-                
-                try:
-                    if icon_path.exists():
-                        self.icons[state] = Image.open(str(icon_path))
-                    else:
-                        self.icons[state] = self._create_fallback_icon(state)
-                        self.logger.warning(f"Icon file not found, using fallback: {icon_path}")
-                        
-                except Exception as e:
-                    self.logger.error(f"Failed to load icon {icon_path}: {e}")
-                    self.icons[state] = self._create_fallback_icon(state)
+            # asset_path is memoized, so re-resolving only costs dict lookups
+            self._icon_paths = {state: asset_path(relative) for state, relative in self._ICON_FILES}
 
         except Exception as e:
-            self.logger.error(f"Failed to load system tray: {e}")
+            self.logger.error("Failed to load system tray: %s", e)
             self.available = False
-        
-    def _create_fallback_icon(self, state: str):
-        colors = {
-            'idle': (128, 128, 128),      # Gray
-            'recording': (34, 139, 34),   # Green
-            'processing': (255, 165, 0)   # Orange
-        }
-        
-        color = colors.get(state, (128, 128, 128))  # Default to gray
-        icon = Image.new('RGBA', (16, 16), color + (255,))
 
+    def _get_icon(self, state: str):
+        """Return the icon image for `state`, opening its file on first request.
+
+        Nothing is opened before a state is first requested; the image is then
+        decoded once and kept in memory, so later icon switches read no files.
+        A fallback is drawn only for a requested state whose file is missing."""
+        icon = self.icons.get(state)
+        if icon is not None:
+            return icon
+        icon_path = self._icon_paths.get(state)
+        if icon_path is None:
+            return None
+        icon = None
+        try:
+            # Just open: a missing file raises, no separate exists() stat
+            icon = Image.open(str(icon_path))
+            icon.load()
+        except FileNotFoundError:
+            self.logger.warning("Icon file not found, using fallback: %s", icon_path)
+            icon = None
+        except Exception as e:
+            self.logger.error("Failed to load icon %s: %s", icon_path, e)
+            icon = None
+        if icon is None:
+            icon = self._create_fallback_icon(state)
+        self.icons[state] = icon
         return icon
+        
+    def _create_fallback_icon(self, state: str):
+        return _make_fallback(state)
     
     def _create_menu(self):
+        """Build the tray menu. Done once: the window item's label is a callable,
+        so icon.update_menu() refreshes it without constructing new items."""
         try:
             if not self.state_manager:
                 raise RuntimeError("State manager not attached yet")
@@ -119,23 +162,11 @@ class SystemTray:
             
             # Add item for showing/hiding window with default action
             if self.is_window_visible_callback and self.show_window_callback:
-                is_visible = self.is_window_visible_callback()
-                if is_visible:
-                    # Check if platform supports default action
-                    has_default = getattr(pystray.Icon, 'HAS_DEFAULT', True)
-                    menu_items.append(pystray.MenuItem(
-                        "Hide Window", 
-                        self._hide_window,
-                        default=has_default
-                    ))
-                else:
-                    # Check if platform supports default action
-                    has_default = getattr(pystray.Icon, 'HAS_DEFAULT', True)
-                    menu_items.append(pystray.MenuItem(
-                        "Show Window", 
-                        self._show_window,
-                        default=has_default
-                    ))
+                menu_items.append(pystray.MenuItem(
+                    self._window_item_text,
+                    self._toggle_window,
+                    default=_HAS_DEFAULT
+                ))
             
             menu_items.append(pystray.MenuItem("Exit", self._quit_application_from_tray))
             
@@ -144,15 +175,18 @@ class SystemTray:
             return menu
                 
         except Exception as e:
-            self.logger.error(f"Error in _create_menu: {e}")
+            self.logger.error("Error in _create_menu: %s", e)
             raise
 
+    def _window_item_text(self, item=None) -> str:
+        return "Hide Window" if self._window_visible else "Show Window"
+
     def _tray_toggle_recording(self, icon=None, item=None):
         self.state_manager.toggle_recording()
 
     def _set_transcription_mode(self, auto_paste: bool):        
         self.state_manager.update_transcription_mode(auto_paste)
-        self.icon.menu = self._create_menu()
+        self.refresh_menu()
 
     def _select_model(self, model_size: str):
         try:
@@ -164,25 +198,19 @@ class SystemTray:
             if success:
                 # Save under new 'model' key
                 self.config_manager.update_user_setting('whisper', 'model', model_size)
-                self.icon.menu = self._create_menu()
+                self.refresh_menu()
             else:
-                self.logger.warning(f"Request to change model to {model_size} was not accepted")
+                self.logger.warning("Request to change model to %s was not accepted", model_size)
                 
         except Exception as e:
-            self.logger.error(f"Error selecting model {model_size}: {e}")
+            self.logger.error("Error selecting model %s: %s", model_size, e)
 
     def _quit_application_from_tray(self, icon=None, item=None):
         self.logger.info("[tray] Exit requested")
         self._quit_flag = True
         
-        # Stop tray in background (don't block callback)
-        def _stop_tray_async():
-            try:
-                self.stop()
-            except Exception:
-                pass
-        
-        threading.Thread(target=_stop_tray_async, daemon=True).start()
+        # Stop tray in background (don't block callback); stop() logs its own errors
+        self._executor.submit(self.stop)
         
         try:
             if self._quit_callback:
@@ -192,7 +220,7 @@ class SystemTray:
                 import os
                 os._exit(0)
         except Exception as e:
-            self.logger.error(f"[tray] Quit callback failed: {e}")
+            self.logger.error("[tray] Quit callback failed: %s", e)
             # Emergency exit
             import os
             os._exit(1)
@@ -200,54 +228,73 @@ class SystemTray:
     def set_quit_callback(self, fn):
         self._quit_callback = fn
 
-    def _show_window(self, icon=None, item=None):
-        """Show application window."""
-        if self.show_window_callback:
-            try:
-                self.show_window_callback()
-                # Update menu after window state change
-                if self.icon:
-                    self.icon.menu = self._create_menu()
-            except Exception as e:
-                self.logger.error(f"Failed to show window: {e}")
-    
-    def _hide_window(self, icon=None, item=None):
-        """Hide application window."""
-        # This function will only be called from the menu,
-        # hiding logic when closing window is handled in UI
+    def _toggle_window(self, icon=None, item=None):
+        """Show or hide the application window (default tray action).
+
+        The UI's show/hide callbacks report the result via notify_window_visibility()."""
         try:
-            if hasattr(self, '_hide_window_callback') and self._hide_window_callback:
-                self._hide_window_callback()
-            # Update menu after window state change
-            if self.icon:
-                self.icon.menu = self._create_menu()
+            if self._window_visible:
+                # Hiding logic when closing the window is handled in UI
+                if getattr(self, '_hide_window_callback', None):
+                    self._hide_window_callback()
+            elif self.show_window_callback:
+                self.show_window_callback()
         except Exception as e:
-            self.logger.error(f"Failed to hide window: {e}")
+            self.logger.error("Failed to toggle window: %s", e)
     
     def set_hide_window_callback(self, callback):
         """Set callback for hiding window."""
         self._hide_window_callback = callback
     
+    def notify_window_visibility(self, visible: bool):
+        """Called by the UI when the window is shown or hidden."""
+        self._window_visible = bool(visible)
+        self.refresh_menu()
+
     def refresh_menu(self):
         """Refresh tray menu to reflect current window state."""
         if self.is_running and self.icon:
-            try:
-                self.icon.menu = self._create_menu()
-                self.logger.info("Tray menu refreshed")
-            except Exception as e:
-                self.logger.error(f"Failed to refresh tray menu: {e}")
+            self._schedule_refresh()
+
+    def _schedule_refresh(self):
+        """Coalesce refresh requests: a burst within REFRESH_DELAY causes one update_menu()."""
+        with self._refresh_lock:
+            if self._pending_refresh:
+                return
+            self._pending_refresh = True
+        timer = threading.Timer(REFRESH_DELAY, self._do_refresh)
+        timer.daemon = True
+        timer.start()
+
+    def _do_refresh(self):
+        with self._refresh_lock:
+            self._pending_refresh = False
+        if not (self.is_running and self.icon):
+            return
+        try:
+            self.icon.update_menu()
+            self.logger.info("Tray menu refreshed")
+        except Exception as e:
+            self.logger.error("Failed to refresh tray menu: %s", e)
     
     def update_state(self, new_state: str):
         if not TRAY_AVAILABLE or not self.is_running:
             return
+        if new_state == self.current_state:
+            return
         
         self.current_state = new_state
         
         try:
-            self.icon.icon = self.icons[new_state]
-            self.icon.menu = self._create_menu()
+            image = self._get_icon(new_state)
+            if image is None:
+                raise KeyError(new_state)
+            # Assigning icon.icon re-uploads the image to the shell, so skip no-ops
+            if image is not self._last_icon_obj:
+                self.icon.icon = image
+                self._last_icon_obj = image
         except Exception as e:
-            self.logger.error(f"Failed to update tray icon: {e}")
+            self.logger.error("Failed to update tray icon: %s", e)
     
     def start(self):        
         if not self.available:
@@ -258,55 +305,43 @@ class SystemTray:
             return True
         
         try:
-            if not self.icons:
+            if not self.icons and not self._icon_paths:
                 self.logger.warning("[tray] no icons loaded; attempting to load now")
                 self._load_icons_to_cache()
-            idle_icon = self.icons.get("idle")
+            idle_icon = self._get_icon("idle")
             if idle_icon is None:
                 self.logger.error("[tray] idle icon missing; aborting start")
                 return False
-            menu = self._create_menu()
+            if self._menu is None:
+                self._menu = self._create_menu()
 
             self.icon = pystray.Icon(
                 name="lazy-to-text",
                 icon=idle_icon,
                 title="Lazy to text",
-                menu=menu
+                menu=self._menu
             )
+            self._last_icon_obj = idle_icon
+            self.current_state = "idle"
             
-            self.logger.debug("[tray] launching tray thread...")
-            self.thread = threading.Thread(target=self._run_tray, daemon=True)
-            self.thread.start()
+            self.logger.debug("[tray] launching detached tray loop...")
+            # pystray runs its own loop in the background; the default setup shows the icon
+            self.icon.run_detached()
 
             self.is_running = True
             self.logger.info("System tray started", extra={'user_message': True})
             return True
         except Exception as e:
-            self.logger.error(f"Failed to start system tray: {e}")
+            self.logger.error("Failed to start system tray: %s", e)
             return False
     
-    def _run_tray(self):
-        try:
-            self.logger.debug("[tray] entering icon.run() loop")
-            self.icon.run()  # pystray runloop (blocking in this thread)
-        except Exception as e:
-            self.logger.error(f"System tray thread error: {e}")
-        finally:
-            self.is_running = False
-            self.logger.debug("[tray] icon thread ended")
-    
     def stop(self):
         if not self.is_running:
             return
         
         try:
             self.icon.stop()
-                
-            # Wait for thread to finish to avoid deadlock
-            if self.thread and self.thread.is_alive() and self.thread != threading.current_thread():
-                self.thread.join(timeout=2.0)
-                
             self.is_running = False
             
         except Exception as e:
-            self.logger.error(f"Error stopping system tray: {e}")
\ No newline at end of file
+            self.logger.error("Error stopping system tray: %s", e)
\ No newline at end of file
@@ -1,32 +1,82 @@
+import atexit
+import functools
 import logging
+import os
 import customtkinter as ctk
 import tkinter as tk
-from typing import List, Optional, Dict, Any
+from collections import deque
+from dataclasses import dataclass
+from typing import Deque, List, Optional, Dict, Any
 import signal
+import tempfile
 import threading
 import time
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from PIL import Image
 
 from app.config_manager import ConfigManager
 from app.whisper_engine import WhisperEngine
 from app.clipboard_manager import ClipboardManager
-from app.model_mapping import alias_for, ALIAS_TO_MODEL
+from app.model_mapping import ALIAS_TO_MODEL, MODEL_TO_ALIAS, canonical_for
 from app.state_manager import StateManager
 from app.hotkey_listener import HotkeyListener
 from app.instance_manager import guard_against_multiple_instances
 from app.audio_recorder import AudioRecorder
 from app.audio_feedback import AudioFeedback
 from app.logging_utils import setup_logging, setup_exception_handler
-from app.utils import get_project_logs_path, resolve_asset_path
+from app.utils import asset_path, project_logs_dir
 from app.system_tray import SystemTray
 from app.logging_utils import EarlyBufferHandler
 from app.docker_backend_manager import DockerBackendManager
 
+log = logging.getLogger(__name__)
+
 MODEL_OPTIONS = list(ALIAS_TO_MODEL.keys())
 LANGUAGE_OPTIONS = ['ru', 'en']
 BUTTON_WIDTH = 140  # Unified width for all primary buttons
+POLL_TICK_MS = 500  # Initial status polling interval
+POLL_FAST_MS = 200  # Interval right after the backend state changed (doubles while unchanged)
+POLL_MAX_MS = 2000  # Back-off cap (no polling at all while hidden to tray)
+LOG_REPAINT_MS = 50  # Log records arriving within this window share one repaint
+SIGNAL_HEARTBEAT_MS = 500  # Keeps mainloop returning to Python so SIGINT/SIGTERM handlers run
+
+# One process-wide pool for blocking UI offloads (Docker/HTTP probes, icon conversion)
+_BG_EXECUTOR = ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 2), thread_name_prefix="ui-bg")
+atexit.register(_BG_EXECUTOR.shutdown, wait=False, cancel_futures=True)
+# Container start/stop/recreate run here one at a time, so they never race on the container
+_DOCKER_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ui-docker")
+atexit.register(_DOCKER_EXECUTOR.shutdown, wait=False, cancel_futures=True)
+
+
+@functools.lru_cache(maxsize=64)
+def _container_model_display(name: str) -> str:
+    """Status line for a container model alias, with its canonical model name"""
+    return f"Container model: {name} ({canonical_for(name)})"
+
+
+@functools.lru_cache(maxsize=128)
+def _normalize_url_impl(raw: str) -> str:
+    """Pure helper behind LazyToTextUI._normalize_url (cached per input string)"""
+    raw = raw.strip()
+    if not raw:
+        return raw
+    if not raw.startswith(('http://', 'https://')):
+        raw = 'http://' + raw
+    while raw.endswith('/') and len(raw) > len('http://')+1:
+        raw = raw[:-1]
+    return raw
+
+
+@functools.lru_cache(maxsize=128)
+def _is_valid_url_impl(u: str) -> bool:
+    """Pure helper behind LazyToTextUI._is_valid_url (cached per input string)"""
+    if not u:
+        return False
+    if not (u.startswith('http://') or u.startswith('https://')):
+        return False
+    without_scheme = u.split('://',1)[1]
+    host = without_scheme.split('/')[0]
+    return host == 'localhost' or '.' in host or ':' in host
 
 # Configure CustomTkinter
 ctk.set_appearance_mode("system")  # Modes: system (default), light, dark
@@ -39,11 +89,12 @@ class ToolTip:
         self.widget = widget
         self.text = text
         self.tooltip_window = None
+        self._motion_bound = False
+        self._last_xy = (-1, -1)  # Last position applied by update_tooltip_position
         
-        # Bind events
+        # Bind events (<Motion> only while the tooltip is shown, see show_tooltip)
         self.widget.bind("<Enter>", self.on_enter)
         self.widget.bind("<Leave>", self.on_leave)
-        self.widget.bind("<Motion>", self.on_motion)
         
     def on_enter(self, event=None):
         """Show tooltip when mouse enters widget"""
@@ -55,8 +106,9 @@ class ToolTip:
         
     def on_motion(self, event=None):
         """Update tooltip position on mouse motion"""
-        if self.tooltip_window:
-            self.update_tooltip_position(event)
+        if not self.tooltip_window:
+            return
+        self.update_tooltip_position(event)
             
     def show_tooltip(self, event=None):
         """Create and show tooltip window"""
@@ -68,7 +120,8 @@ class ToolTip:
         
         self.tooltip_window = tk.Toplevel(self.widget)
         self.tooltip_window.wm_overrideredirect(True)
-        self.tooltip_window.wm_geometry(f"+{x}+{y}")
+        self.tooltip_window.wm_geometry("+%d+%d" % (x, y))
+        self._last_xy = (x, y)
         
         # Style the tooltip
         label = tk.Label(
@@ -83,36 +136,134 @@ class ToolTip:
         )
         label.pack()
         
+        if not self._motion_bound:
+            self.widget.bind("<Motion>", self.on_motion, add="+")
+            self._motion_bound = True
+        
     def update_tooltip_position(self, event=None):
         """Update tooltip position"""
         if self.tooltip_window and event:
             x = event.x_root + 10
             y = event.y_root + 10
-            self.tooltip_window.wm_geometry(f"+{x}+{y}")
+            # Ignore sub-4px jitter: each move is a Tcl geometry round-trip
+            last_x, last_y = self._last_xy
+            if abs(x - last_x) < 4 and abs(y - last_y) < 4:
+                return
+            self._last_xy = (x, y)
+            self.tooltip_window.wm_geometry("+%d+%d" % (x, y))
             
     def hide_tooltip(self):
         """Destroy tooltip window"""
         if self.tooltip_window:
             self.tooltip_window.destroy()
             self.tooltip_window = None
+        if self._motion_bound:
+            # No funcid: CTk widgets reject it and re-create their own bindings
+            self.widget.unbind("<Motion>")
+            self._motion_bound = False
             
     def update_text(self, new_text):
         """Update tooltip text"""
         self.text = new_text
 
 class UILogHandler(logging.Handler):
-    def __init__(self, append_fn, level=logging.INFO, max_lines=500):
+    """Queues records that the UI has not shown yet; `append_fn` is only a
+    change notification, the UI takes the new lines with drain() when it repaints.
+    Records are formatted in drain(), on the UI thread, not by the logging thread.
+    Below WARNING at most `rate_per_sec` records per second are kept, the rest are
+    counted and reported as one summary line.
+    The textbox itself holds the history (trimmed to `max_lines`)."""
+    def __init__(self, append_fn, level=logging.INFO, max_lines=500, rate_per_sec=200):
         super().__init__(level)
         self.append_fn = append_fn
         self.max_lines = max_lines
-        self._buffer: List[str] = []
+        # More than max_lines pending would be trimmed right away, so cap it there
+        self._pending: Deque[logging.LogRecord] = deque(maxlen=max_lines)
+        # Token bucket; emit() runs under the handler lock, so no extra locking
+        self.rate_per_sec = rate_per_sec
+        self._tokens = float(rate_per_sec)
+        self._last_refill = time.monotonic()
+        self._dropped = 0
+        self._last_drop_report = self._last_refill
 
     def emit(self, record: logging.LogRecord):
-        msg = self.format(record)
-        self._buffer.append(msg)
-        if len(self._buffer) > self.max_lines:
-            self._buffer = self._buffer[-self.max_lines:]
-        self.append_fn("\n".join(self._buffer))
+        now = time.monotonic()
+        rate = self.rate_per_sec
+        self._tokens = min(rate, self._tokens + (now - self._last_refill) * rate)
+        self._last_refill = now
+        if self._tokens < 1:
+            if record.levelno < logging.WARNING:
+                self._dropped += 1
+                return
+        else:
+            self._tokens -= 1
+        if self._dropped and now - self._last_drop_report >= 1.0:
+            self._pending.append(logging.LogRecord(
+                __name__, logging.WARNING, __file__, 0,
+                "(suppressed %d log messages)", (self._dropped,), None))
+            self._dropped = 0
+            self._last_drop_report = now
+        self._pending.append(record)
+        self.append_fn()
+
+    def drain(self) -> List[str]:
+        """Pop every pending record (oldest first) and return them formatted."""
+        lines = []
+        pop = self._pending.popleft
+        try:
+            while True:
+                lines.append(self.format(pop()))
+        except IndexError:
+            pass
+        return lines
+
+class CachedDockerMgr:
+    """Read-only view of DockerBackendManager for the UI polling paths: each query is
+    answered from memory for `ttl` seconds (keyed by method and arguments).
+    Container operations go to the real manager, followed by invalidate()."""
+    STATUS_TTL = 1.0
+    AVAILABILITY_TTL = 5.0
+
+    def __init__(self, mgr: DockerBackendManager):
+        self._mgr = mgr
+        self._cache: Dict[tuple, tuple] = {}  # key -> (value, expiry)
+
+    def _cached(self, ttl: float, name: str, *args):
+        key = (name, *args)
+        now = time.monotonic()
+        hit = self._cache.get(key)
+        if hit is not None and now < hit[1]:
+            return hit[0]
+        value = getattr(self._mgr, name)(*args)
+        self._cache[key] = (value, now + ttl)
+        return value
+
+    def invalidate(self):
+        """Forget every cached answer (after start/stop/recreate)"""
+        self._cache.clear()
+
+    def is_available(self) -> bool:
+        return self._cached(self.AVAILABILITY_TTL, 'is_available')
+
+    def get_health_and_status(self, health_checker) -> tuple[str, bool]:
+        return self._cached(self.STATUS_TTL, 'get_health_and_status', health_checker)
+
+    def get_container_model_info(self, engine=None) -> Optional[str]:
+        return self._cached(self.STATUS_TTL, 'get_container_model_info', engine)
+
+    def get_container_beam_info(self) -> Optional[int]:
+        return self._cached(self.STATUS_TTL, 'get_container_beam_info')
+
+    def get_container_lang_info(self) -> Optional[str]:
+        return self._cached(self.STATUS_TTL, 'get_container_lang_info')
+
+
+@dataclass(frozen=True)
+class HotkeySnapshot:
+    """Hotkey settings as last read from config (refreshed on reconfigure)"""
+    start: str
+    stop: Optional[str]
+
 
 class AppContext:
     def __init__(self):
@@ -131,21 +282,20 @@ class AppContext:
         wyoming_url = self._convert_url_for_wyoming(base_url)
         
         canonical_model = whisper_cfg.get('model')
-        # If model in config is already an alias, use it directly; otherwise convert
+        # Config may hold an alias or a canonical name; both tables are prebuilt maps
         if canonical_model in ALIAS_TO_MODEL:
             alias = canonical_model  # It's already an alias
-            canonical = ALIAS_TO_MODEL[canonical_model]
         else:
-            # It's a canonical name, convert to alias  
-            alias = alias_for(canonical_model) if canonical_model else 'turbo'
-            canonical = canonical_model
+            alias = MODEL_TO_ALIAS.get(canonical_model, canonical_model) if canonical_model else 'turbo'
+        canonical = canonical_for(canonical_model)
             
         self.engine = WhisperEngine(
             base_url=wyoming_url,
             model_size=alias,
             language=whisper_cfg['language'],
             beam_size=whisper_cfg['beam_size'],
-            remote_model=canonical
+            remote_model=canonical,
+            silence_threshold=whisper_cfg['silence_threshold']
         )
         self.backend_mode = backend_mode
         self.clipboard_manager = ClipboardManager(
@@ -175,6 +325,15 @@ class AppContext:
         )
         self.hotkey_listener: HotkeyListener | None = None
         self._mutex_handle = None
+        self.hotkeys = self._read_hotkey_snapshot()
+
+    def _read_hotkey_snapshot(self) -> HotkeySnapshot:
+        cfg = self.config_manager
+        hotkey_cfg = cfg.config['hotkey']
+        return HotkeySnapshot(
+            start=cfg.get_setting('hotkey', 'start_recording_hotkey'),
+            stop=cfg.get_setting('hotkey', 'stop_recording_hotkey') if 'stop_recording_hotkey' in hotkey_cfg else None,
+        )
 
     def _convert_url_for_wyoming(self, url: str) -> str:
         """Converts HTTP URL to Wyoming format (removes http:// prefix)."""
@@ -196,19 +355,19 @@ class AppContext:
             self._mutex_handle = guard_against_multiple_instances("LazyToTextUIHotkeys")
         except SystemExit:
             self._mutex_handle = None
-            logging.getLogger(__name__).warning("Another instance already holds hotkey mutex; hotkeys disabled in this window.")
+            log.warning("Another instance already holds hotkey mutex; hotkeys disabled in this window.")
             return
         try:
             self.hotkey_listener = HotkeyListener(
                 state_manager=self.state_manager,
-                start_recording_hotkey=self.config_manager.get_setting('hotkey','start_recording_hotkey'),
-                stop_recording_hotkey=self.config_manager.get_setting('hotkey','stop_recording_hotkey') if 'stop_recording_hotkey' in self.config_manager.config['hotkey'] else None,
+                start_recording_hotkey=self.hotkeys.start,
+                stop_recording_hotkey=self.hotkeys.stop,
                 cancel_combination=None
             )
-            logging.getLogger(__name__).info("Hotkeys enabled in UI")
+            log.info("Hotkeys enabled in UI")
             self.last_hotkey_error = None
         except Exception as e:
-            logging.getLogger(__name__).error(f"Failed to start hotkeys: {e}")
+            log.error(f"Failed to start hotkeys: {e}")
             self.last_hotkey_error = str(e)
             self.hotkey_listener = None
 
@@ -220,23 +379,26 @@ class AppContext:
                 pass
             self.hotkey_listener = None
         self._mutex_handle = None
-        logging.getLogger(__name__).info("Hotkeys disabled in UI")
+        log.info("Hotkeys disabled in UI")
 
     def _on_max_duration(self, audio_data):
-        logging.getLogger(__name__).info("Max duration reached (UI callback)")
+        log.info("Max duration reached (UI callback)")
         self.state_manager.handle_max_recording_duration_reached(audio_data)
 
     def reconfigure_hotkeys_if_active(self):
+        # Settings may have changed: refresh the snapshot even if hotkeys are off
+        self.hotkeys = self._read_hotkey_snapshot()
         if not self.hotkey_listener:
             return
         try:
             self.disable_hotkeys()
             self.enable_hotkeys()
         except Exception as e:
-            logging.getLogger(__name__).error(f"Failed to reconfigure hotkeys: {e}")
+            log.error(f"Failed to reconfigure hotkeys: {e}")
 
     def shutdown(self):
         self.disable_hotkeys()
+        self.engine.close()
 
 
 class LazyToTextUI:
@@ -245,6 +407,11 @@ class LazyToTextUI:
         self.root.title("Lazy to text")
         self.root.geometry("720x550")
         
+        # Background tasks go to the shared pool (set first: the icon setup uses it)
+        self.executor = _BG_EXECUTOR
+        self._docker_executor = _DOCKER_EXECUTOR
+        self._docker_busy = False  # A container operation is queued or running
+        
         # Set application icon
         self.set_app_icon()
         
@@ -254,6 +421,8 @@ class LazyToTextUI:
         # Initialize application context
         self.ctx = AppContext()
         self.docker_mgr = DockerBackendManager()
+        # Polling/UI refreshes read through this; operations use docker_mgr directly
+        self.docker_status = CachedDockerMgr(self.docker_mgr)
         
         # State flags
         self.quitting_flag = False
@@ -262,16 +431,30 @@ class LazyToTextUI:
         
         # UI elements
         self.widgets: Dict[str, Any] = {}
+        # Widgets touched on every poll, bound directly once created (None until then)
+        self.w_server_status = None
+        self.w_container_model = None
+        self.w_switch_button = None
+        self.w_start_btn = None
+        self.w_stop_btn = None
+        self._last_status_text: str | None = None  # Last text written to the status panel
+        # (text, color) last applied to the server status / container model labels
+        self._server_status_cache: tuple | None = None
+        self._container_model_cache: tuple | None = None
+        self._last_switch_key: tuple | None = None  # Inputs of the last update_switch_button_state
+        self._last_switch_btn_state: str | None = None
+        self._last_status_tuple = None  # Backend state seen by the last status poll
         
         # Track changes for save buttons
         self.hotkey_settings_changed = False
         
         # Save original values for comparison
-        self.original_hotkey_settings = {}
+        self.original_hotkey_settings: tuple = ()  # (start, stop, auto_paste)
+        self._save_hotkeys_btn_state = "disabled"  # Apply button is created disabled
         
-        # Threading for background tasks
-        self.executor = ThreadPoolExecutor(max_workers=2)
         self.polling_running = False
+        self._poll_after_id = None
+        self._early_handler: EarlyBufferHandler | None = None
         
         self.setup_logging()
         self.setup_system_tray()
@@ -283,56 +466,80 @@ class LazyToTextUI:
         """Set application icon using the same icon as system tray"""
         try:
             # Try to load the same icon as used in system tray
-            png_path = Path(resolve_asset_path("assets/tray_idle.png"))
-            ico_path = png_path.parent / "tray_idle.ico"
-            
-            if png_path.exists():
-                # Convert PNG to ICO if ICO doesn't exist
-                if not ico_path.exists():
-                    try:
-                        img = Image.open(png_path)
-                        # Convert to RGBA if not already
-                        if img.mode != 'RGBA':
-                            img = img.convert('RGBA')
-                        # Save as ICO with multiple sizes
-                        img.save(ico_path, format='ICO', sizes=[(16,16), (32,32), (48,48), (64,64)])
-                        logging.getLogger(__name__).debug(f"Created ICO file: {ico_path}")
-                    except Exception as e:
-                        logging.getLogger(__name__).warning(f"Failed to create ICO file: {e}")
-                
-                # Try different methods to set the icon
-                success = False
-                
-                # Method 1: Try iconbitmap with ICO file
-                if ico_path.exists():
-                    try:
-                        self.root.wm_iconbitmap(str(ico_path))
-                        success = True
-                        logging.getLogger(__name__).debug("Application icon set using iconbitmap (ICO)")
-                    except Exception as e:
-                        logging.getLogger(__name__).debug(f"iconbitmap failed: {e}")
-                
-                # Method 2: Try iconphoto with PNG
-                if not success:
-                    try:
-                        photo = tk.PhotoImage(file=str(png_path))
-                        self.root.call("wm", "iconphoto", self.root._w, photo)
-                        self.root.wm_iconphoto(True, photo)
-                        self.app_icon = photo  # Keep reference
-                        success = True
-                        logging.getLogger(__name__).debug("Application icon set using iconphoto (PNG)")
-                    except Exception as e:
-                        logging.getLogger(__name__).debug(f"iconphoto failed: {e}")
-                
-                if success:
-                    logging.getLogger(__name__).debug("Application icon set successfully")
-                else:
-                    logging.getLogger(__name__).warning("All icon setting methods failed")
-            else:
-                logging.getLogger(__name__).warning(f"Icon file not found: {png_path}")
+            png_path = asset_path("assets/tray_idle.png")
+            # Generated copy lives in a temp cache, never in the (tracked or
+            # read-only) assets directory
+            ico_path = Path(tempfile.gettempdir()) / "lazy-to-text" / "tray_idle.ico"
+            
+            if not png_path.exists():
+                log.warning(f"Icon file not found: {png_path}")
+                return
+            
+            # Regenerate the ICO only when it is missing or older than the PNG
+            ico_stale = not ico_path.exists() or ico_path.stat().st_mtime < png_path.stat().st_mtime
+            
+            # Method 1: Try iconbitmap with an up-to-date ICO file
+            if not ico_stale and self._apply_ico_icon(ico_path):
+                log.debug("Application icon set successfully")
+                return
+            
+            # Method 2: iconphoto with PNG right away, so the window does not wait for PIL
+            success = self._apply_png_icon(png_path)
+            
+            if ico_stale:
+                # Build the ICO off the UI thread and switch to it once written
+                def _on_ico_built(fut):
+                    if not fut.cancelled() and fut.exception() is None and fut.result():
+                        self.root.after(0, lambda: self._apply_ico_icon(ico_path))
+                self.executor.submit(self._build_ico, png_path, ico_path).add_done_callback(_on_ico_built)
+            
+            if success:
+                log.debug("Application icon set successfully")
+            elif not ico_stale:
+                log.warning("All icon setting methods failed")
                 
         except Exception as e:
-            logging.getLogger(__name__).warning(f"Failed to set application icon: {e}")
+            log.warning(f"Failed to set application icon: {e}")
+
+    def _apply_ico_icon(self, ico_path: Path) -> bool:
+        try:
+            self.root.wm_iconbitmap(str(ico_path))
+            log.debug("Application icon set using iconbitmap (ICO)")
+            return True
+        except Exception as e:
+            log.debug(f"iconbitmap failed: {e}")
+            return False
+
+    def _apply_png_icon(self, png_path: Path) -> bool:
+        try:
+            photo = tk.PhotoImage(file=str(png_path))
+            self.root.call("wm", "iconphoto", self.root._w, photo)
+            self.root.wm_iconphoto(True, photo)
+            self.app_icon = photo  # Keep reference
+            log.debug("Application icon set using iconphoto (PNG)")
+            return True
+        except Exception as e:
+            log.debug(f"iconphoto failed: {e}")
+            return False
+
+    @staticmethod
+    def _build_ico(png_path: Path, ico_path: Path) -> bool:
+        """Convert the PNG to a multi-size ICO (runs in the executor)"""
+        try:
+            # Imported here so the UI thread never pays for loading PIL
+            from PIL import Image
+            img = Image.open(png_path)
+            # Convert to RGBA if not already
+            if img.mode != 'RGBA':
+                img = img.convert('RGBA')
+            # Save as ICO with multiple sizes
+            ico_path.parent.mkdir(parents=True, exist_ok=True)
+            img.save(ico_path, format='ICO', sizes=[(16,16), (32,32), (48,48), (64,64)])
+            log.debug(f"Created ICO file: {ico_path}")
+            return True
+        except Exception as e:
+            log.warning(f"Failed to create ICO file: {e}")
+            return False
 
     def setup_logging(self):
         """Setup logging system"""
@@ -341,6 +548,8 @@ class LazyToTextUI:
         if not any(isinstance(h, EarlyBufferHandler) for h in root_logger.handlers):
             early_handler = EarlyBufferHandler()
             root_logger.addHandler(early_handler)
+        # Remembered so setup_ui_logging can drop it without rescanning handlers
+        self._early_handler = early_handler
 
         setup_logging(self.ctx.config_manager)
 
@@ -350,10 +559,9 @@ class LazyToTextUI:
             except Exception:
                 pass
         try:
-            import os
             log_cfg = self.ctx.config_manager.get_logging_config()
-            log_path = os.path.join(get_project_logs_path(), log_cfg['file']['filename'])
-            logging.getLogger(__name__).info(f"UI log file path: {log_path}")
+            log_path = project_logs_dir() / log_cfg['file']['filename']
+            log.info(f"UI log file path: {log_path}")
         except Exception:
             pass
 
@@ -382,17 +590,16 @@ class LazyToTextUI:
                 # Start tray
                 started = self.system_tray.start()
                 if not started:
-                    logging.getLogger(__name__).warning("System tray not started")
+                    log.warning("System tray not started")
                     
             except Exception as e:
-                logging.getLogger(__name__).warning(f"System tray init failed: {e}")
+                log.warning(f"System tray init failed: {e}")
                 self.system_tray = None
 
     def create_widgets(self):
         """Create interface widgets"""
         # Create main frames without scrollable container
         main_frame = ctk.CTkFrame(self.root, fg_color="transparent")
-        main_frame.pack(fill="both", expand=True, padx=20, pady=10)
         
         # Model section
         self.create_model_section(main_frame)
@@ -414,6 +621,10 @@ class LazyToTextUI:
         # Logs section
         self.create_logs_section(main_frame)
         
+        # Map the frame once all sections are packed, so the window lays out a single time
+        main_frame.pack(fill="both", expand=True, padx=20, pady=10)
+        self.root.update_idletasks()
+        
         # Setup UI logging
         self.setup_ui_logging()
         
@@ -472,6 +683,8 @@ class LazyToTextUI:
         )
         self.widgets['beam_size'].insert(0, str(self.ctx.engine.beam_size))
         self.widgets['beam_size'].pack(side="left", padx=5)
+        self.widgets['beam_size'].bind('<KeyRelease>', self.on_beam_change)
+        self.widgets['beam_size'].bind('<FocusOut>', self.on_beam_change)
         
         self.widgets['language_dropdown'] = ctk.CTkOptionMenu(
             model_controls_frame,
@@ -498,6 +711,9 @@ class LazyToTextUI:
         self.widgets['server_status'] = ctk.CTkLabel(parent, text="Server status: ?", text_color="gray")
         self.widgets['container_model'] = ctk.CTkLabel(parent, text="Container model: ?", text_color="gray")
         # Не вызываем pack, чтобы не дублировать с панелью Status
+        self.w_server_status = self.widgets['server_status']
+        self.w_container_model = self.widgets['container_model']
+        self.w_switch_button = self.widgets['switch_button']
         
         # Create and update backend buttons
         self.create_backend_buttons()
@@ -544,11 +760,14 @@ class LazyToTextUI:
                 lines.append(f"Current model: {self.ctx.engine.model_size} (lang: {self.ctx.engine.language}, beam: {self.ctx.engine.beam_size})")
 
             text = "\n".join(lines)
+            if text == self._last_status_text:
+                return
 
             box.configure(state="normal")
             box.delete("1.0","end")
             box.insert("1.0", text)
             box.configure(state="disabled")
+            self._last_status_text = text
         except Exception:
             pass
 
@@ -557,6 +776,7 @@ class LazyToTextUI:
         # Clear frame
         for widget in self.widgets['backend_buttons_frame'].winfo_children():
             widget.destroy()
+        self.w_start_btn = self.w_stop_btn = None
             
         if self.ctx.backend_mode == 'local':
             self.widgets['start_backend_button'] = ctk.CTkButton(
@@ -574,15 +794,17 @@ class LazyToTextUI:
                 width=BUTTON_WIDTH
             )
             self.widgets['stop_backend_button'].pack(side="left", padx=5)
+            self.w_start_btn = self.widgets['start_backend_button']
+            self.w_stop_btn = self.widgets['stop_backend_button']
             
             # Add tooltips for backend buttons
             try:
-                ToolTip(self.widgets['start_backend_button'], 
+                self._lazy_tooltip(self.widgets['start_backend_button'], 
                        "Start Docker container")
-                ToolTip(self.widgets['stop_backend_button'], 
+                self._lazy_tooltip(self.widgets['stop_backend_button'], 
                        "Stop Docker container")
             except Exception as e:
-                logging.getLogger(__name__).warning(f"Failed to add backend button tooltips: {e}")
+                log.warning(f"Failed to add backend button tooltips: {e}")
 
     def create_hotkeys_section(self, parent):
         """Create hotkeys settings section"""
@@ -599,7 +821,7 @@ class LazyToTextUI:
             placeholder_text="Start hotkey",
             width=160
         )
-        self.widgets['start_hotkey'].insert(0, self.ctx.config_manager.get_setting('hotkey','start_recording_hotkey'))
+        self.widgets['start_hotkey'].insert(0, self.ctx.hotkeys.start)
         self.widgets['start_hotkey'].bind('<KeyRelease>', self.on_hotkey_settings_change)
         self.widgets['start_hotkey'].pack(side="left", padx=5)
         
@@ -608,7 +830,7 @@ class LazyToTextUI:
             placeholder_text="Stop hotkey",
             width=160
         )
-        stop_value = self.ctx.config_manager.get_setting('hotkey','stop_recording_hotkey') if 'stop_recording_hotkey' in self.ctx.config_manager.config['hotkey'] else ''
+        stop_value = self.ctx.hotkeys.stop or ''
         self.widgets['stop_hotkey'].insert(0, stop_value)
         self.widgets['stop_hotkey'].bind('<KeyRelease>', self.on_hotkey_settings_change)
         self.widgets['stop_hotkey'].pack(side="left", padx=5)
@@ -669,26 +891,52 @@ class LazyToTextUI:
 
     def setup_ui_logging(self):
         """Setup UI logging"""
-        def update_log(text: str):
+        # Records only mark the log dirty; one repaint per LOG_REPAINT_MS picks up
+        # everything that arrived in between
+        self._log_dirty = threading.Event()
+        self._log_repaint_scheduled = False
+
+        def update_log():
             # Safe UI update from another thread
-            self.root.after(0, lambda: self._update_log_safe(text))
+            self._log_dirty.set()
+            if not self._log_repaint_scheduled:
+                self._log_repaint_scheduled = True
+                self.root.after(LOG_REPAINT_MS, self._flush_log)
         
         handler = UILogHandler(update_log, level=logging.INFO)
+        self._ui_log_handler = handler
         handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
         
         root_logger = logging.getLogger()
-        # Remove old early handlers
-        for h in list(root_logger.handlers):
-            if isinstance(h, EarlyBufferHandler):
-                root_logger.removeHandler(h)
+        # Remove the early handler installed by setup_logging, if any
+        if self._early_handler is not None:
+            root_logger.removeHandler(self._early_handler)
+            self._early_handler = None
         root_logger.addHandler(handler)
         root_logger.setLevel(logging.INFO)
 
-    def _update_log_safe(self, text: str):
+    def _flush_log(self):
+        """Scheduled repaint: render the log once if anything arrived since the last one"""
+        self._log_repaint_scheduled = False
+        if self._log_dirty.is_set():
+            self._log_dirty.clear()
+            self._update_log_safe()
+
+    def _update_log_safe(self):
         """Safe log update in UI thread"""
         try:
-            self.widgets['log_output'].delete("1.0", "end")
-            self.widgets['log_output'].insert("1.0", text)
+            handler = self._ui_log_handler
+            lines = handler.drain()
+            if not lines:
+                return
+            box = self.widgets['log_output']
+            # Append only the new lines, then trim the head back to max_lines
+            box.insert("end", "\n".join(lines) + "\n")
+            line_count = int(box.index("end-1c").split('.')[0]) - 1
+            overflow = line_count - handler.max_lines
+            if overflow > 0:
+                box.delete("1.0", f"{overflow + 1}.0")
+            box.see("end")
         except Exception:
             # If we can't update UI, just ignore
             pass
@@ -706,116 +954,179 @@ class LazyToTextUI:
             else:
                 self.update_status("Hotkeys NOT enabled (mutex busy)")
 
+    def _lazy_tooltip(self, widget, text):
+        """Attach a tooltip that is only constructed on the first hover"""
+        def _first_enter(event, w=widget, t=text):
+            # No funcid: CTk widgets reject it and re-create their own bindings
+            w.unbind("<Enter>")
+            ToolTip(w, t).on_enter(event)
+        widget.bind("<Enter>", _first_enter, add="+")
+
     def add_model_tooltips(self):
         """Add tooltips to model section widgets"""
         try:
             # Backend mode tooltip
-            ToolTip(self.widgets['backend_mode'], 
+            self._lazy_tooltip(self.widgets['backend_mode'], 
                    "local: Docker container\nexternal: Remote server")
             
             # External URL tooltip
-            ToolTip(self.widgets['external_url'], 
+            self._lazy_tooltip(self.widgets['external_url'], 
                    "External Whisper server URL\nExample: localhost:10300")
             
             # Model dropdown tooltip
-            ToolTip(self.widgets['model_dropdown'], 
+            self._lazy_tooltip(self.widgets['model_dropdown'], 
                    "Whisper model size")
             
             # Beam size tooltip
-            ToolTip(self.widgets['beam_size'], 
+            self._lazy_tooltip(self.widgets['beam_size'], 
                    "Beam search size (1-20)\nLower=faster, Higher=better")
             
             # Language dropdown tooltip
-            ToolTip(self.widgets['language_dropdown'], 
+            self._lazy_tooltip(self.widgets['language_dropdown'], 
                    "Speech recognition language")
             
             # Switch button tooltip
-            ToolTip(self.widgets['switch_button'], 
+            self._lazy_tooltip(self.widgets['switch_button'], 
                    "Apply model settings")
             
         except Exception as e:
-            logging.getLogger(__name__).warning(f"Failed to add model tooltips: {e}")
+            log.warning(f"Failed to add model tooltips: {e}")
 
     def add_hotkeys_tooltips(self):
         """Add tooltips to hotkeys section widgets"""
         try:
-            ToolTip(self.widgets['start_hotkey'], "Hotkey to start recording")
-            ToolTip(self.widgets['stop_hotkey'], "Hotkey to stop recording")
-            ToolTip(self.widgets['auto_paste_checkbox'], "Auto-paste recognized text")
-            ToolTip(self.widgets['save_hotkeys_button'], "Apply hotkey changes")
+            self._lazy_tooltip(self.widgets['start_hotkey'], "Hotkey to start recording")
+            self._lazy_tooltip(self.widgets['stop_hotkey'], "Hotkey to stop recording")
+            self._lazy_tooltip(self.widgets['auto_paste_checkbox'], "Auto-paste recognized text")
+            self._lazy_tooltip(self.widgets['save_hotkeys_button'], "Apply hotkey changes")
         except Exception as e:
-            logging.getLogger(__name__).warning(f"Failed to add hotkeys tooltips: {e}")
+            log.warning(f"Failed to add hotkeys tooltips: {e}")
 
     def add_logs_tooltips(self):
         """Add tooltips to logs section widgets"""
         try:
             # Clear logs button tooltip
-            ToolTip(self.widgets['clear_logs_button'], 
+            self._lazy_tooltip(self.widgets['clear_logs_button'], 
                    "Clear all log messages")
             
             # Log output tooltip
-            ToolTip(self.widgets['log_output'], 
+            self._lazy_tooltip(self.widgets['log_output'], 
                    "Application logs and status messages")
             
         except Exception as e:
-            logging.getLogger(__name__).warning(f"Failed to add logs tooltips: {e}")
+            log.warning(f"Failed to add logs tooltips: {e}")
 
     def start_polling(self):
-        """Start background status polling"""
+        """Start status polling (Tk timer; only the backend probe runs in the executor)"""
         self.polling_running = True
-        self.executor.submit(self._polling_loop)
+        self._poll_interval_ms = POLL_TICK_MS
+        self._poll_future = None
+        self._poll_wake_requested = False
+        self._schedule_poll()
 
-    def _polling_loop(self):
-        """Background status polling loop"""
-        counter = 0
-        while self.polling_running and not self.quitting_flag:
+    def stop_polling(self):
+        """Stop status polling: drop the armed tick and a probe that has not started yet"""
+        self.polling_running = False
+        if self._poll_after_id is not None:
             try:
-                counter += 1
-                
-                # Poll less frequently if window is hidden
-                check_interval = 5 if self.window_visible else 20
-                
-                if counter >= check_interval:
-                    counter = 0
-                    self._update_backend_status()
-                    
-                # Update Switch button state
-                if self.window_visible:
-                    self.root.after(0, self.update_switch_button_state)
-                    
-            except Exception as e:
-                logging.getLogger(__name__).debug(f"Polling error: {e}")
-                
-            time.sleep(0.5)
+                self.root.after_cancel(self._poll_after_id)
+            except Exception:
+                pass
+            self._poll_after_id = None
+        fut = getattr(self, '_poll_future', None)
+        if fut is not None:
+            fut.cancel()  # No effect once running; its done-callback sees polling stopped
+
+    def wake_polling(self):
+        """Probe the backend right away, e.g. after a user action (call from the Tk thread)"""
+        if not self.polling_running or self.quitting_flag:
+            return
+        self._poll_interval_ms = POLL_FAST_MS
+        if self._poll_future is not None and not self._poll_future.done():
+            # A probe is in flight; its completion schedules the next one without delay
+            self._poll_wake_requested = True
+            return
+        if self._poll_after_id is not None:
+            try:
+                self.root.after_cancel(self._poll_after_id)
+            except Exception:
+                pass
+        self._poll_after_id = self.root.after(0, self._poll_tick)
+
+    def _schedule_poll(self):
+        """Arm the next poll tick (Tk thread); the chain ends once polling is stopped"""
+        self._poll_after_id = None
+        if not self.polling_running or self.quitting_flag:
+            return
+        delay = 0 if self._poll_wake_requested else self._poll_interval_ms
+        self._poll_wake_requested = False
+        self._poll_after_id = self.root.after(delay, self._poll_tick)
+
+    def _poll_tick(self):
+        """One polling step on the Tk thread: hand the probe to the executor.
+        The next tick is scheduled when the probe finishes, so probes never overlap."""
+        self._poll_after_id = None
+        if not self.polling_running or self.quitting_flag:
+            return
+        if not self.window_visible:
+            # Nothing shows backend status while hidden (the tray has no status items);
+            # the chain parks here and show_window() restarts it via wake_polling()
+            return
+        try:
+            # Blocking Docker/HTTP probe goes to the executor; it posts results back via root.after
+            self._poll_future = self.executor.submit(self._update_backend_status)
+            self._poll_future.add_done_callback(self._on_probe_done)
+        except Exception as e:
+            log.debug("Polling error: %s", e)
+            self._schedule_poll()
+
+    def _on_probe_done(self, fut):
+        """Adapt the polling interval: back off while the backend state is unchanged,
+        then chain the next tick (worker thread)"""
+        if not fut.cancelled() and fut.exception() is None:
+            status = fut.result()
+            if status != self._last_status_tuple:
+                self._last_status_tuple = status
+                self._poll_interval_ms = POLL_FAST_MS
+            else:
+                self._poll_interval_ms = min(self._poll_interval_ms * 2, POLL_MAX_MS)
+        if self.polling_running and not self.quitting_flag:
+            try:
+                self.root.after(0, self._schedule_poll)
+            except Exception:
+                pass
 
     def _update_backend_status(self):
-        """Update backend status"""
+        """Update backend status; returns the observed state (compared between polls)"""
         try:
+            # Results go back to the Tk thread as one snapshot, applied in a single idle
+            # callback so Tk redraws once after all the configure calls
+            # 'buttons' carries the polled (status, docker_available) in local mode only
+            snap: Dict[str, Any] = {'server': None, 'container_model': None, 'buttons': None}
             if self.ctx.backend_mode == 'local':
-                container_status, health_ok = self.docker_mgr.get_health_and_status(self.ctx.engine.health_check)
-                docker_available = self.docker_mgr.is_available()
+                container_status, health_ok = self.docker_status.get_health_and_status(self.ctx.engine.health_check)
+                docker_available = self.docker_status.is_available()
                 
-                self.root.after(0, lambda: self.update_backend_buttons_state())
+                snap['buttons'] = (container_status, docker_available)
                 
                 if not docker_available:
-                    self.root.after(0, lambda: self._update_server_status("Server status: not running (docker unavailable)", "red"))
+                    snap['server'] = ("Server status: not running (docker unavailable)", "red")
                 elif container_status == 'running' and health_ok:
-                    self.root.after(0, lambda: self._update_server_status("Server status: running", "green"))
+                    snap['server'] = ("Server status: running", "green")
                     # Update container model information
-                    container_model = self.docker_mgr.get_container_model_info(self.ctx.engine)
+                    container_model = self.docker_status.get_container_model_info(self.ctx.engine)
                     if container_model:
-                        # Get canonical model name
-                        canonical_name = ALIAS_TO_MODEL.get(container_model, container_model)
-                        display_text = f"Container model: {container_model} ({canonical_name})"
-                        self.root.after(0, lambda: self._update_container_model(display_text, "green"))
+                        snap['container_model'] = (_container_model_display(container_model), "green")
                     else:
-                        self.root.after(0, lambda: self._update_container_model("Container model: unknown", "gray"))
+                        snap['container_model'] = ("Container model: unknown", "gray")
                 elif container_status in ('stopped', 'not_found'):
-                    self.root.after(0, lambda: self._update_server_status("Server status: not running", "gray"))
-                    self.root.after(0, lambda: self._update_container_model("Container model: -", "gray"))
+                    snap['server'] = ("Server status: not running", "gray")
+                    snap['container_model'] = ("Container model: -", "gray")
                 else:
-                    self.root.after(0, lambda: self._update_server_status("Server status: error", "red"))
-                    self.root.after(0, lambda: self._update_container_model("Container model: error", "red"))
+                    snap['server'] = ("Server status: error", "red")
+                    snap['container_model'] = ("Container model: error", "red")
+                self.root.after_idle(self._apply_status_snapshot, snap)
+                return container_status, health_ok, docker_available
             else:
                 # External mode
                 try:
@@ -824,29 +1135,60 @@ class LazyToTextUI:
                     ok = False
                 
                 if ok:
-                    self.root.after(0, lambda: self._update_server_status("Server status: running", "green"))
+                    snap['server'] = ("Server status: running", "green")
                 else:
-                    self.root.after(0, lambda: self._update_server_status("Server status: error", "red"))
+                    snap['server'] = ("Server status: error", "red")
+                self.root.after_idle(self._apply_status_snapshot, snap)
+                return 'external', ok
                     
         except Exception as e:
-            logging.getLogger(__name__).debug(f"Backend status update error: {e}")
+            log.debug("Backend status update error: %s", e)
+        return None
+
+    def _apply_status_snapshot(self, snap: Dict[str, Any]):
+        """Apply one _update_backend_status result on the Tk thread"""
+        try:
+            changed = False
+            if snap['server'] is not None:
+                changed |= self._update_server_status(*snap['server'], refresh=False)
+            if snap['container_model'] is not None:
+                changed |= self._update_container_model(*snap['container_model'], refresh=False)
+            if snap['buttons'] is not None:
+                self._apply_backend_buttons(*snap['buttons'])
+            if changed:
+                self.refresh_status_panel()
+            # Container model/beam/lang may have drifted; a no-op when nothing changed
+            self.update_switch_button_state()
+        except Exception:
+            pass
 
-    def _update_server_status(self, text: str, color: str):
-        """Update server status in UI"""
+    def _update_server_status(self, text: str, color: str, refresh: bool = True) -> bool:
+        """Update server status in UI (refresh=False when the caller repaints the panel itself).
+        Returns False, touching nothing, when text and color are already shown."""
+        if (text, color) == self._server_status_cache:
+            return False
         try:
-            self.widgets['server_status'].configure(text=text, text_color=color)
+            self.w_server_status.configure(text=text, text_color=color)
+            self._server_status_cache = (text, color)
             # Refresh status panel if exists
-            self.refresh_status_panel()
+            if refresh:
+                self.refresh_status_panel()
         except Exception:
             pass
+        return True
 
-    def _update_container_model(self, text: str, color: str):
-        """Update container model information in UI"""
+    def _update_container_model(self, text: str, color: str, refresh: bool = True) -> bool:
+        """Update container model information in UI (refresh/return value as above)"""
+        if (text, color) == self._container_model_cache:
+            return False
         try:
-            self.widgets['container_model'].configure(text=text, text_color=color)
-            self.refresh_status_panel()
+            self.w_container_model.configure(text=text, text_color=color)
+            self._container_model_cache = (text, color)
+            if refresh:
+                self.refresh_status_panel()
         except Exception:
             pass
+        return True
 
     # Event handlers
     def on_backend_mode_change(self, value):
@@ -856,6 +1198,9 @@ class LazyToTextUI:
         # Recreate backend buttons
         self.create_backend_buttons()
         self.update_backend_buttons_state()
+        self.refresh_status_panel()
+        self.update_switch_button_state()
+        self.wake_polling()
 
     def on_model_change(self, value):
         """Model change handler"""
@@ -881,23 +1226,25 @@ class LazyToTextUI:
     def save_original_values(self):
         """Save original values for change tracking"""
         # Hotkey settings
-        self.original_hotkey_settings = {
-            'start_hotkey': self.widgets['start_hotkey'].get(),
-            'stop_hotkey': self.widgets['stop_hotkey'].get(),
-            'auto_paste_checkbox': self.widgets['auto_paste_checkbox'].get()
-        }
+        self.original_hotkey_settings = self._current_hotkey_values()
+
+    def _current_hotkey_values(self) -> tuple:
+        """(start, stop, auto_paste) as currently entered in the hotkeys section"""
+        return (self.widgets['start_hotkey'].get(),
+                self.widgets['stop_hotkey'].get(),
+                self.widgets['auto_paste_checkbox'].get())
 
     def check_hotkey_settings_changed(self):
         """Check for changes in hotkey settings"""
-        current_values = {
-            'start_hotkey': self.widgets['start_hotkey'].get(),
-            'stop_hotkey': self.widgets['stop_hotkey'].get(),
-            'auto_paste_checkbox': self.widgets['auto_paste_checkbox'].get()
-        }
-        
-        changed = current_values != self.original_hotkey_settings
+        changed = self._current_hotkey_values() != self.original_hotkey_settings
         self.hotkey_settings_changed = changed
-        self.widgets['save_hotkeys_button'].configure(state="normal" if changed else "disabled")
+        self._set_save_hotkeys_state("normal" if changed else "disabled")
+
+    def _set_save_hotkeys_state(self, state: str):
+        """Configure the Save button only when its state actually changes"""
+        if state != self._save_hotkeys_btn_state:
+            self.widgets['save_hotkeys_button'].configure(state=state)
+            self._save_hotkeys_btn_state = state
 
     def update_switch_button_state(self):
         """Update Switch button state"""
@@ -908,9 +1255,17 @@ class LazyToTextUI:
             selected_language = self.widgets['language_dropdown'].get()
             current_language = self.ctx.engine.language
             
+            beam_text = self.widgets['beam_size'].get()
+            
+            # Same inputs (and same polled backend state) give the same answer
+            key = (selected_model, selected_language, beam_text, current_model, current_language,
+                   self.ctx.engine.beam_size, self.ctx.backend_mode, self._last_status_tuple)
+            if key == self._last_switch_key and self._last_switch_btn_state is not None:
+                return
+            
             # Check beam size
             try:
-                selected_beam = int(self.widgets['beam_size'].get().strip())
+                selected_beam = int(beam_text.strip())
                 current_beam = self.ctx.engine.beam_size
                 is_beam_different = selected_beam != current_beam
             except (ValueError, AttributeError):
@@ -918,9 +1273,9 @@ class LazyToTextUI:
             
             if self.ctx.backend_mode == 'local':
                 # For local mode also check container
-                container_model = self.docker_mgr.get_container_model_info(self.ctx.engine)
-                container_beam = self.docker_mgr.get_container_beam_info()
-                container_lang = self.docker_mgr.get_container_lang_info()
+                container_model = self.docker_status.get_container_model_info(self.ctx.engine)
+                container_beam = self.docker_status.get_container_beam_info()
+                container_lang = self.docker_status.get_container_lang_info()
                 
                 is_model_different = not ((selected_model == current_model) or (container_model == selected_model))
                 is_container_beam_different = container_beam != selected_beam if container_beam is not None else True
@@ -933,10 +1288,14 @@ class LazyToTextUI:
                 is_lang_different = selected_language != current_language
                 should_enable = is_model_different or is_beam_different or is_lang_different
             
-            self.widgets['switch_button'].configure(state="normal" if should_enable else "disabled")
+            state = "normal" if should_enable else "disabled"
+            if state != self._last_switch_btn_state:
+                self.w_switch_button.configure(state=state)
+                self._last_switch_btn_state = state
+            self._last_switch_key = key
             
         except Exception as e:
-            logging.getLogger(__name__).debug(f"Error updating switch button state: {e}")
+            log.debug("Error updating switch button state: %s", e)
 
     def update_backend_buttons_state(self):
         """Update backend buttons state"""
@@ -944,34 +1303,29 @@ class LazyToTextUI:
             return
             
         try:
-            container_status, _ = self.docker_mgr.get_health_and_status(self.ctx.engine.health_check)
-            docker_available = self.docker_mgr.is_available()
-            
-            if not docker_available:
-                if 'start_backend_button' in self.widgets:
-                    self.widgets['start_backend_button'].configure(state="disabled")
-                if 'stop_backend_button' in self.widgets:
-                    self.widgets['stop_backend_button'].configure(state="disabled")
-                return
-                
-            if container_status == 'running':
-                if 'start_backend_button' in self.widgets:
-                    self.widgets['start_backend_button'].configure(state="disabled")
-                if 'stop_backend_button' in self.widgets:
-                    self.widgets['stop_backend_button'].configure(state="normal")
-            elif container_status in ('stopped', 'not_found'):
-                if 'start_backend_button' in self.widgets:
-                    self.widgets['start_backend_button'].configure(state="normal")
-                if 'stop_backend_button' in self.widgets:
-                    self.widgets['stop_backend_button'].configure(state="disabled")
-            else:
-                if 'start_backend_button' in self.widgets:
-                    self.widgets['start_backend_button'].configure(state="normal")
-                if 'stop_backend_button' in self.widgets:
-                    self.widgets['stop_backend_button'].configure(state="disabled")
+            container_status, _ = self.docker_status.get_health_and_status(self.ctx.engine.health_check)
+            docker_available = self.docker_status.is_available()
+            self._apply_backend_buttons(container_status, docker_available)
                     
         except Exception as e:
-            logging.getLogger(__name__).debug(f"Error updating backend buttons state: {e}")
+            log.debug("Error updating backend buttons state: %s", e)
+
+    def _apply_backend_buttons(self, container_status: str, docker_available: bool):
+        """Set Start/Stop from an already known backend state (no Docker query)"""
+        if not docker_available:
+            self._set_backend_buttons("disabled", "disabled")
+        elif container_status == 'running':
+            self._set_backend_buttons("disabled", "normal")
+        else:
+            # stopped / not_found / unknown: only starting makes sense
+            self._set_backend_buttons("normal", "disabled")
+
+    def _set_backend_buttons(self, start_state: str, stop_state: str):
+        """Configure the Start/Stop buttons (no-op for buttons that do not exist)"""
+        if self.w_start_btn is not None:
+            self.w_start_btn.configure(state=start_state)
+        if self.w_stop_btn is not None:
+            self.w_stop_btn.configure(state=stop_state)
 
     # Button handlers
     def save_hotkeys(self):
@@ -996,20 +1350,19 @@ class LazyToTextUI:
             
             # Reset change flag and disable button
             self.hotkey_settings_changed = False
-            self.widgets['save_hotkeys_button'].configure(state="disabled")
+            self._set_save_hotkeys_state("disabled")
             
             # Save new original values
-            self.original_hotkey_settings = {
-                'start_hotkey': self.widgets['start_hotkey'].get(),
-                'stop_hotkey': self.widgets['stop_hotkey'].get(),
-                'auto_paste_checkbox': self.widgets['auto_paste_checkbox'].get()
-            }
+            self.original_hotkey_settings = self._current_hotkey_values()
             
         except Exception as e:
             self.update_status(f"Error saving hotkeys: {e}")
 
     def switch_model(self):
         """Switch model"""
+        if self._docker_busy:
+            self.update_status("Operation in progress")
+            return
         try:
             new_model = self.widgets['model_dropdown'].get()
             new_language = self.widgets['language_dropdown'].get()
@@ -1036,9 +1389,11 @@ class LazyToTextUI:
             self.update_status(f"Switching to {new_model} (beam: {new_beam_size}, lang: {new_language})...")
             
             # Run switching in background thread
-            self.executor.submit(self._async_switch_model, new_model, new_beam_size, new_language)
+            self._docker_busy = True
+            self._docker_executor.submit(self._async_switch_model, new_model, new_beam_size, new_language)
             
         except Exception as e:
+            self._docker_busy = False
             self.update_status(f"Error switching model: {e}")
             self.show_progress(False)
 
@@ -1053,133 +1408,166 @@ class LazyToTextUI:
             self.ctx.engine.model_size = new_model
             self.ctx.engine.beam_size = new_beam_size
             self.ctx.engine.language = new_language
-            canonical = ALIAS_TO_MODEL.get(new_model, new_model)
+            canonical = canonical_for(new_model)
             self.ctx.engine.remote_model = canonical
             
             self.ctx.config_manager.update_user_setting('whisper','model', new_model)
             self.ctx.config_manager.update_user_setting('whisper','beam_size', new_beam_size)
             self.ctx.config_manager.update_user_setting('whisper','language', new_language)
             
+            # The outcome is applied on the Tk thread in one go by _apply_switch_result
+            updates: Dict[str, Any] = {'status': None, 'server_status': None, 'container_model': None,
+                                       'refresh_buttons': False}
             if self.ctx.backend_mode == 'local':
-                # Restart Docker container
+                # Restart Docker container (progress message goes out before the long call)
                 self.root.after(0, lambda: self.update_status(f"Creating new container with {new_model} (beam: {new_beam_size}, lang: {new_language})..."))
                 
                 container_result = self.docker_mgr.restart_with_model_beam_and_lang(new_model, new_beam_size, new_language)
+                self.docker_status.invalidate()
                 
                 if container_result == "running":
-                    self.root.after(0, lambda: self.update_status(f"Switched to {new_model} (beam: {new_beam_size}, lang: {new_language}, container recreated)"))
-                    self.root.after(0, lambda: self._update_server_status("Server status: running", "green"))
+                    updates['status'] = f"Switched to {new_model} (beam: {new_beam_size}, lang: {new_language}, container recreated)"
+                    updates['server_status'] = ("Server status: running", "green")
                     
                     # Update container model information
-                    container_model = self.docker_mgr.get_container_model_info(self.ctx.engine)
+                    container_model = self.docker_status.get_container_model_info(self.ctx.engine)
                     if container_model:
-                        # Get canonical model name
-                        canonical_name = ALIAS_TO_MODEL.get(container_model, container_model)
-                        display_text = f"Container model: {container_model} ({canonical_name})"
-                        self.root.after(0, lambda: self._update_container_model(display_text, "green"))
+                        updates['container_model'] = (_container_model_display(container_model), "green")
                     else:
-                        self.root.after(0, lambda: self._update_container_model("Container model: unknown", "gray"))
+                        updates['container_model'] = ("Container model: unknown", "gray")
                 else:
-                    self.root.after(0, lambda: self.update_status(f"Failed to restart container: {container_result}"))
-                    self.root.after(0, lambda: self._update_server_status("Server status: error", "red"))
-                    self.root.after(0, lambda: self._update_container_model("Container model: error", "red"))
+                    updates['status'] = f"Failed to restart container: {container_result}"
+                    updates['server_status'] = ("Server status: error", "red")
+                    updates['container_model'] = ("Container model: error", "red")
                 
                 # Update backend buttons state
-                self.root.after(0, self.update_backend_buttons_state)
+                updates['refresh_buttons'] = True
             else:
                 # External mode
-                self.root.after(0, lambda: self.update_status(f"Switched to {new_model} (beam: {new_beam_size}, lang: {new_language}, external server)"))
+                updates['status'] = f"Switched to {new_model} (beam: {new_beam_size}, lang: {new_language}, external server)"
             
-            self.root.after(0, lambda: self.show_progress(False))
-            self.root.after(0, self.update_switch_button_state)
+            self.root.after_idle(self._apply_switch_result, updates)
             
-            logging.getLogger(__name__).info(f"Model switched: {old_model} -> {new_model}, beam: {old_beam} -> {new_beam_size}, language: {old_language} -> {new_language}")
+            log.info(f"Model switched: {old_model} -> {new_model}, beam: {old_beam} -> {new_beam_size}, language: {old_language} -> {new_language}")
             
         except Exception as ex:
-            logging.getLogger(__name__).error(f"Model switch error: {ex}")
-            error_msg = str(ex)  # Save error message
-            self.root.after(0, lambda: self.update_status(f"Error switching model: {error_msg}"))
-            self.root.after(0, lambda: self.show_progress(False))
-            self.root.after(0, self.update_switch_button_state)
+            log.error(f"Model switch error: {ex}")
+            self.docker_status.invalidate()
+            self.root.after_idle(self._apply_switch_result, {
+                'status': f"Error switching model: {ex}",
+                'server_status': None, 'container_model': None, 'refresh_buttons': False,
+            })
+        finally:
+            self._docker_busy = False
+
+    def _apply_switch_result(self, updates: Dict[str, Any]):
+        """Apply the outcome of _async_switch_model on the Tk thread"""
+        try:
+            if updates['status']:
+                self.update_status(updates['status'])
+            if updates['server_status'] is not None:
+                self._update_server_status(*updates['server_status'], refresh=False)
+            if updates['container_model'] is not None:
+                self._update_container_model(*updates['container_model'], refresh=False)
+            if updates['refresh_buttons']:
+                self.update_backend_buttons_state()
+            self.refresh_status_panel()
+        except Exception:
+            pass
+        self.show_progress(False)
+        self.update_switch_button_state()
+        self.wake_polling()
 
     def start_backend(self):
         """Start backend"""
+        if self._docker_busy:
+            self.update_status("Operation in progress")
+            return
         try:
             # Disable buttons
-            if 'start_backend_button' in self.widgets:
-                self.widgets['start_backend_button'].configure(state="disabled")
-            if 'stop_backend_button' in self.widgets:
-                self.widgets['stop_backend_button'].configure(state="disabled")
+            self._set_backend_buttons("disabled", "disabled")
             
             self.update_status("Starting container...")
             
             # Run in background thread
-            self.executor.submit(self._async_start_backend)
+            self._docker_busy = True
+            self._docker_executor.submit(self._async_start_backend)
             
         except Exception as e:
+            self._docker_busy = False
             self.update_status(f"Error starting backend: {e}")
 
     def _async_start_backend(self):
         """Asynchronous backend start"""
         try:
             res = self.docker_mgr.start()
-            logging.getLogger(__name__).info(f"Backend start: {res}")
+            self.docker_status.invalidate()
+            log.info(f"Backend start: {res}")
             
             status_text = "Container running" if res == 'running' else f"Container status: {res}"
             self.root.after(0, lambda: self.update_status(status_text))
             
             # Update UI state
-            self.root.after(0, self._update_backend_status)
-            self.root.after(0, self.update_backend_buttons_state)
+            self.root.after(0, self.wake_polling)
+            self.root.after_idle(self.update_backend_buttons_state)
             
         except Exception as ex:
-            logging.getLogger(__name__).error(f"Backend start error: {ex}")
+            log.error(f"Backend start error: {ex}")
+            self.docker_status.invalidate()
             error_msg = str(ex)
             self.root.after(0, lambda: self.update_status(f"Error starting backend: {error_msg}"))
-            self.root.after(0, self.update_backend_buttons_state)
+            self.root.after_idle(self.update_backend_buttons_state)
+        finally:
+            self._docker_busy = False
 
     def stop_backend(self):
         """Stop backend"""
+        if self._docker_busy:
+            self.update_status("Operation in progress")
+            return
         try:
             # Disable buttons
-            if 'start_backend_button' in self.widgets:
-                self.widgets['start_backend_button'].configure(state="disabled")
-            if 'stop_backend_button' in self.widgets:
-                self.widgets['stop_backend_button'].configure(state="disabled")
+            self._set_backend_buttons("disabled", "disabled")
             
             self.update_status("Stopping container...")
             
             # Run in background thread
-            self.executor.submit(self._async_stop_backend)
+            self._docker_busy = True
+            self._docker_executor.submit(self._async_stop_backend)
             
         except Exception as e:
+            self._docker_busy = False
             self.update_status(f"Error stopping backend: {e}")
 
     def _async_stop_backend(self):
         """Asynchronous backend stop"""
         try:
             res = self.docker_mgr.stop()
-            logging.getLogger(__name__).info(f"Backend stop: {res}")
+            self.docker_status.invalidate()
+            log.info(f"Backend stop: {res}")
             
             status_text = "Container stopped" if res in ('stopped','not_found') else f"Container status: {res}"
             self.root.after(0, lambda: self.update_status(status_text))
             
             # Update UI state
-            self.root.after(0, self._update_backend_status)
-            self.root.after(0, self.update_backend_buttons_state)
+            self.root.after(0, self.wake_polling)
+            self.root.after_idle(self.update_backend_buttons_state)
             
         except Exception as ex:
-            logging.getLogger(__name__).error(f"Backend stop error: {ex}")
+            log.error(f"Backend stop error: {ex}")
+            self.docker_status.invalidate()
             error_msg = str(ex)
             self.root.after(0, lambda: self.update_status(f"Error stopping backend: {error_msg}"))
-            self.root.after(0, self.update_backend_buttons_state)
+            self.root.after_idle(self.update_backend_buttons_state)
+        finally:
+            self._docker_busy = False
 
     def clear_logs(self):
         """Clear logs"""
         try:
             self.widgets['log_output'].delete("1.0", "end")
         except Exception as e:
-            logging.getLogger(__name__).warning(f"Error clearing logs: {e}")
+            log.warning(f"Error clearing logs: {e}")
 
     def hide_to_tray_manually(self):
         """Manual hide to tray"""
@@ -1187,12 +1575,12 @@ class LazyToTextUI:
             if self.system_tray and self.system_tray.is_running:
                 self.hide_window()
                 self.update_status("Window hidden to system tray")
-                logging.getLogger(__name__).info("Window manually hidden to system tray")
+                log.info("Window manually hidden to system tray")
             else:
                 self.update_status("System tray not available")
-                logging.getLogger(__name__).warning("Attempted to hide to tray but system tray not active")
+                log.warning("Attempted to hide to tray but system tray not active")
         except Exception as e:
-            logging.getLogger(__name__).error(f"Manual hide to tray failed: {e}")
+            log.error(f"Manual hide to tray failed: {e}")
             self.update_status(f"Error hiding to tray: {e}")
 
     # Utility methods
@@ -1212,30 +1600,17 @@ class LazyToTextUI:
         """Update status through log"""
         try:
             # Send status to log as INFO message
-            logging.getLogger(__name__).info(text, extra={'user_message': True})
+            log.info(text, extra={'user_message': True})
         except Exception:
             pass
 
     def _normalize_url(self, raw: str) -> str:
         """URL normalization"""
-        raw = raw.strip()
-        if not raw:
-            return raw
-        if not raw.startswith(('http://', 'https://')):
-            raw = 'http://' + raw
-        while raw.endswith('/') and len(raw) > len('http://')+1:
-            raw = raw[:-1]
-        return raw
+        return _normalize_url_impl(raw)
 
     def _is_valid_url(self, u: str) -> bool:
         """URL validity check"""
-        if not u:
-            return False
-        if not (u.startswith('http://') or u.startswith('https://')):
-            return False
-        without_scheme = u.split('://',1)[1]
-        host = without_scheme.split('/')[0]
-        return host == 'localhost' or '.' in host or ':' in host
+        return _is_valid_url_impl(u)
 
     # Window management
     def hide_window(self):
@@ -1245,10 +1620,10 @@ class LazyToTextUI:
             self.window_visible = False
             # Update tray menu to reflect window state change
             if self.system_tray and self.system_tray.is_running:
-                self.system_tray.refresh_menu()
-            logging.getLogger(__name__).info("Window hidden via callback")
+                self.system_tray.notify_window_visibility(False)
+            log.info("Window hidden via callback")
         except Exception as ex:
-            logging.getLogger(__name__).error(f"Hide window callback failed: {ex}")
+            log.error(f"Hide window callback failed: {ex}")
 
     def show_window(self):
         """Show window"""
@@ -1257,12 +1632,14 @@ class LazyToTextUI:
             self.root.lift()       # Bring to front
             self.root.focus_force()  # Give focus
             self.window_visible = True
+            # Polling is parked while hidden; refresh the panel right away
+            self.root.after(0, self.wake_polling)
             # Update tray menu to reflect window state change
             if self.system_tray and self.system_tray.is_running:
-                self.system_tray.refresh_menu()
-            logging.getLogger(__name__).info("Window shown via callback")
+                self.system_tray.notify_window_visibility(True)
+            log.info("Window shown via callback")
         except Exception as ex:
-            logging.getLogger(__name__).error(f"Show window failed: {ex}")
+            log.error(f"Show window failed: {ex}")
 
     def is_window_visible(self) -> bool:
         """Check window visibility"""
@@ -1275,68 +1652,51 @@ class LazyToTextUI:
         except Exception:
             tray_active = False
             
-        logging.getLogger(__name__).info(f"on_close called: tray_active={tray_active}, quit_flag={self.quitting_flag}")
+        log.info(f"on_close called: tray_active={tray_active}, quit_flag={self.quitting_flag}")
             
         if tray_active and not self.quitting_flag:
             # Tray is active and not forcing exit - hide window
-            logging.getLogger(__name__).info("Attempting to hide window to system tray")
+            log.info("Attempting to hide window to system tray")
             try:
                 self.hide_window()
                 return  # Don't close application
             except Exception as e:
-                logging.getLogger(__name__).error(f"Failed to hide window to tray: {e}")
+                log.error(f"Failed to hide window to tray: {e}")
                 # If hiding failed, continue with normal closing
          
         # Complete application shutdown
-        logging.getLogger(__name__).info("Proceeding with complete application shutdown")
+        log.info("Proceeding with complete application shutdown")
         self.quit_application()
 
     def quit_via_tray(self):
         """Quit via tray"""
         try:
             self.quitting_flag = True
-            logging.getLogger(__name__).info("Quit via tray called")
+            log.info("Quit via tray called")
             
             # Stop polling
-            self.polling_running = False
+            self.stop_polling()
             
             # Stop tray
             if self.system_tray and self.system_tray.is_running:
                 try:
                     self.system_tray.stop()
                 except Exception as e:
-                    logging.getLogger(__name__).warning(f"system_tray.stop failed: {e}")
+                    log.warning(f"system_tray.stop failed: {e}")
             
             # Clean up resources
             try:
                 self.ctx.shutdown()
             except Exception as e:
-                logging.getLogger(__name__).warning(f"ctx.shutdown failed: {e}")
-            
-            logging.getLogger(__name__).info("Terminating process")
+                log.warning(f"ctx.shutdown failed: {e}")
             
-            # Force termination with small delay
-            def delayed_terminate():
-                time.sleep(0.2)
-                try:
-                    import os
-                    import sys
-                    current_pid = os.getpid()
-                    if sys.platform == "win32":
-                        os.system(f"taskkill /F /PID {current_pid}")
-                    else:
-                        os.kill(current_pid, 9)
-                except Exception as e:
-                    logging.getLogger(__name__).error(f"Failed to terminate process: {e}")
-                    import os
-                    os._exit(1)
+            log.info("Terminating process")
             
-            term_thread = threading.Thread(target=delayed_terminate, daemon=True)
-            term_thread.start()
+            # Resources are released above; exit without waiting on Tk or worker threads
+            os._exit(0)
             
         except Exception as e:
-            logging.getLogger(__name__).error(f"Quit via tray failed: {e}")
-            import os
+            log.error(f"Quit via tray failed: {e}")
             os._exit(1)
 
     def quit_application(self):
@@ -1344,47 +1704,43 @@ class LazyToTextUI:
         self.quitting_flag = True
         
         # Stop polling
-        self.polling_running = False
+        self.stop_polling()
         
         # Clean up resources
         try:
             self.ctx.shutdown()
         except Exception as e:
-            logging.getLogger(__name__).error(f"Error during ctx.shutdown: {e}")
+            log.error(f"Error during ctx.shutdown: {e}")
         
         try:
             if self.system_tray:
                 self.system_tray.stop()
         except Exception as e:
-            logging.getLogger(__name__).error(f"Error stopping tray: {e}")
+            log.error(f"Error stopping tray: {e}")
         
-        # Stop executor
-        try:
-            self.executor.shutdown(wait=False)
-        except Exception as e:
-            logging.getLogger(__name__).error(f"Error shutting down executor: {e}")
+        # The shared executor is shut down at interpreter exit (atexit), not here
         
-        logging.getLogger(__name__).info("Application shutdown complete")
+        log.info("Application shutdown complete")
         
         # Close Tkinter
         try:
             self.root.quit()
             self.root.destroy()
         except Exception as e:
-            logging.getLogger(__name__).error(f"Error closing Tkinter: {e}")
+            log.error(f"Error closing Tkinter: {e}")
 
     def run(self):
         """Application startup"""
         # Initial backend status check
         try:
             if self.ctx.backend_mode == 'local':
-                initial_status, _ = self.docker_mgr.get_health_and_status(self.ctx.engine.health_check)
+                initial_status, _ = self.docker_status.get_health_and_status(self.ctx.engine.health_check)
                 self.update_backend_buttons_state()
         except Exception:
             pass
         
         # Start UI
-        logging.getLogger(__name__).info("Starting Tkinter UI")
+        log.info("Starting Tkinter UI")
         self.root.mainloop()
 
 
@@ -1392,20 +1748,33 @@ def main():
     """Main function"""
     import threading
     shutdown_event = threading.Event()
+    app = None
     
     def signal_handler(signum, frame):
-        logging.getLogger(__name__).info(f"UI received signal {signum} - shutting down gracefully")
+        log.info(f"UI received signal {signum} - shutting down gracefully")
         shutdown_event.set()
+        if app is not None:
+            try:
+                app.root.after(0, app.quit_application)
+            except Exception:
+                pass
     
     signal.signal(signal.SIGTERM, signal_handler)
-    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGINT, signal_handler)
     setup_exception_handler()
     
+    def heartbeat():
+        # Python signal handlers only run when the main thread executes bytecode;
+        # with the window hidden (polling parked) nothing else wakes mainloop
+        if app is not None and not app.quitting_flag:
+            app.root.after(SIGNAL_HEARTBEAT_MS, heartbeat)
+    
     try:
         app = LazyToTextUI()
+        app.root.after(SIGNAL_HEARTBEAT_MS, heartbeat)
         app.run()
     except KeyboardInterrupt:
-        logging.getLogger(__name__).info("UI shutting down...")
+        log.info("UI shutting down...")
     finally:
         signal.signal(signal.SIGINT, signal.SIG_DFL)
         signal.signal(signal.SIGTERM, signal.SIG_DFL)
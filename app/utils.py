@@ -1,94 +1,110 @@
+import functools
 import os
 import sys
 import importlib.resources
 from pathlib import Path
 
+def _noop(*args, **kwargs):
+    return None
+
 class OptionalComponent:
     def __init__(self, component):
         self._component = component
     
     def __getattr__(self, name):
+        # Only called on a miss; resolved methods (and the no-op) are stored on the
+        # instance so later lookups never come back here. Data attributes such as
+        # is_running are read through every time so they never go stale.
         if self._component and hasattr(self._component, name):
             attr = getattr(self._component, name)
-            return attr
+            if not callable(attr):
+                return attr
         else:
-            return lambda *args, **kwargs: None
+            attr = _noop
+        setattr(self, name, attr)
+        return attr
 
 
+@functools.lru_cache(maxsize=64)
 def beautify_hotkey(hotkey_string: str) -> str:
     if not hotkey_string:
         return ""
     
-    return hotkey_string.replace('+', '+').upper()
+    return hotkey_string.upper()
 
+@functools.lru_cache(maxsize=1)
 def is_installed_package():
     # Check if running from an installed package
     return 'site-packages' in __file__
 
-def get_config_path() -> str:
-    """Return path to single config.yaml (root next to exe or project root).
+@functools.lru_cache(maxsize=1)
+def _project_root() -> Path:
+    """Base directory for config.yaml and logs; fixed for the life of the process.
 
     Rules:
       * frozen: next to executable
       * installed (site-packages): current working directory
       * dev: walk up to pyproject.toml
     """
-    if getattr(sys, 'frozen', False):
-        base = Path(sys.executable).parent
-    elif is_installed_package():
-        base = Path.cwd()
-    else:
-        current = Path(__file__).parent
-        base = None
-        for p in [current, *current.parents]:
-            if (p / 'pyproject.toml').exists():
-                base = p
-                break
-        if base is None:
-            base = current.parent.parent.parent
-    return str(base / 'config.yaml')
+    if getattr(sys, 'frozen', False):  # PyInstaller bundle
+        return Path(sys.executable).parent
+    if is_installed_package():
+        return Path.cwd()
+    current = Path(__file__).parent
+    for p in [current, *current.parents]:
+        if (p / 'pyproject.toml').exists():
+            return p
+    return current.parent.parent.parent
 
-def get_project_logs_path():
+def config_file() -> Path:
+    """Return path to single config.yaml (root next to exe or project root, see _project_root)."""
+    return _project_root() / 'config.yaml'
+
+def get_config_path() -> str:
+    """String form of config_file()."""
+    return os.fspath(config_file())
+
+@functools.lru_cache(maxsize=1)
+def project_logs_dir() -> Path:
     """Return unified logs directory inside project (or next to exe when frozen).
 
         Decision: always write logs to the project `logs` directory per requirement.
         Behavior now:
             * PyInstaller: next to the executable /logs
-            * Any other case (dev, installed package) — project root /logs
+            * Installed package: working directory (where user launched the tool) /logs
+            * Development: project root /logs
         Logs are always local in the logs directory.
+        The project root does not change within a process, so the result is cached.
     """
-    if getattr(sys, 'frozen', False):  # PyInstaller bundle
-        exe_dir = Path(sys.executable).parent
-        logs_dir = exe_dir / 'logs'
-    elif is_installed_package():
-        # For installed packages, place logs in the working directory (where user launched the tool)
-        logs_dir = Path.cwd() / 'logs'
-    else:
-        # Walk upward until we find pyproject.toml to determine project root.
-        current = Path(__file__).parent
-        probe = current
-        project_root = None
-        for p in [probe, *probe.parents]:
-            if (p / 'pyproject.toml').exists():
-                project_root = p
-                break
-        if project_root is None:
-            project_root = current.parent.parent.parent
-        logs_dir = project_root / 'logs'
+    logs_dir = _project_root() / 'logs'
+    logs_dir.mkdir(parents=True, exist_ok=True)
+    return logs_dir
 
-    os.makedirs(logs_dir, exist_ok=True)
-    return str(logs_dir)
+def get_project_logs_path() -> str:
+    """String form of project_logs_dir()."""
+    return os.fspath(project_logs_dir())
+
+@functools.lru_cache(maxsize=1)
+def _asset_base() -> Path:
+    """Directory assets are resolved against; fixed for the life of the process."""
+    if getattr(sys, 'frozen', False): # PyInstaller
+        return Path(sys._MEIPASS)
+    
+    if is_installed_package(): # pip / pipx
+        # Regular (on-disk) package: files() is a concrete path, so Path() keeps
+        # the Path API (stat, with_suffix) callers of asset_path rely on
+        return Path(importlib.resources.files("app"))
+    
+    return Path(__file__).parent # Development
+
+@functools.lru_cache(maxsize=32)
+def asset_path(relative_path: str) -> Path:
+    """Bundled asset location for a non-empty relative path."""
+    return _asset_base() / relative_path
 
 def resolve_asset_path(relative_path: str) -> str:
     
     if not relative_path or os.path.isabs(relative_path):
         return relative_path
     
-    if getattr(sys, 'frozen', False): # PyInstaller
-        return str(Path(sys._MEIPASS) / relative_path)
-    
-    if is_installed_package(): # pip / pipx
-        files = importlib.resources.files("app")
-        return str(files / relative_path)
-    
-    return str(Path(__file__).parent / relative_path) # Development
\ No newline at end of file
+    return str(asset_path(relative_path))
\ No newline at end of file
@@ -1,4 +1,8 @@
 import logging
+import socket
+import struct
+import sys
+import threading
 import time
 import asyncio
 import re
@@ -10,6 +14,8 @@ from wyoming.audio import AudioChunk, AudioStart, AudioStop
 from wyoming.client import AsyncTcpClient
 from wyoming.info import Describe
 
+from app._audio_kernels import NUMBA_AVAILABLE, f32_to_i16, warm_up
+
 
 class WhisperEngine:
     """Wyoming protocol WhisperEngine.
@@ -19,6 +25,10 @@ class WhisperEngine:
     """
 
     SAMPLE_RATE = 16000
+    STREAM_BLOCK = 32768  # Samples converted and sent per AudioChunk (64 KiB of int16)
+    HEALTH_CACHE_TTL = 2.0  # Seconds a health_check answer is reused
+    # struct linger {onoff, linger}: u_short fields on Windows, int elsewhere
+    _LINGER_OFF = struct.pack('HH' if sys.platform == 'win32' else 'ii', 1, 0)
 
     @staticmethod
     def _clean_transcription_text(text: str) -> str:
@@ -45,24 +55,39 @@ class WhisperEngine:
                  language: str | None = None,
                  beam_size: int = 5,
                  remote_model: str | None = None,
-                 timeout: float = 30.0):
+                 timeout: float = 30.0,
+                 silence_threshold: float = 0.005):
         # Parse URL to get host and port
         if not base_url.startswith(('tcp://', 'http://', 'https://')):
             base_url = f"tcp://{base_url}"
         
-        parsed = urlparse(base_url)
-        self.host = parsed.hostname or 'localhost'
-        self.port = parsed.port or 10300
+        self.host, self.port = self._parse_host_port(base_url)
         self.model_size = model_size
         self.remote_model = remote_model or ""
-        self.language = None if language == 'auto' else language
+        self.language = None if language == 'auto' else language  # Also builds _transcribe_event
         self.beam_size = beam_size
         self.logger = logging.getLogger(__name__)
         self.timeout = timeout
+        # Clips with a lower peak amplitude are not sent to the server
+        self.silence_threshold = silence_threshold
         self.device = 'remote'
         self.compute_type = 'remote'
         self._info_cache = None
         self._info_cache_ts = None
+        self._info_refreshing = False  # A background get_models refresh is running
+        self._health_cache: tuple[bool, float] | None = None  # (ok, monotonic time)
+        # Long-lived event loop on a daemon thread; every coroutine runs there (see _run)
+        self._bg_loop: asyncio.AbstractEventLoop | None = None
+        self._bg_lock = threading.Lock()
+        # Work buffers for _to_int16, STREAM_BLOCK samples each
+        self._scratch_f32: np.ndarray | None = None
+        self._scratch_i16: np.ndarray | None = None
+        # Fixed protocol events, built once instead of per transcription
+        self._audio_start_event = AudioStart(rate=self.SAMPLE_RATE, width=2, channels=1).event()
+        self._audio_stop_event = AudioStop().event()
+        if NUMBA_AVAILABLE:
+            # JIT the int16 kernel now on the background loop, not on the first transcription
+            self._loop().call_soon_threadsafe(self._warm_kernel)
 
     # Backward compatibility
     def is_loading(self) -> bool:
@@ -80,17 +105,40 @@ class WhisperEngine:
         if not new_url.startswith(('tcp://', 'http://', 'https://')):
             new_url = f"tcp://{new_url}"
         
-        parsed = urlparse(new_url)
         old_host, old_port = self.host, self.port
-        self.host = parsed.hostname or 'localhost'
-        self.port = parsed.port or 10300
+        self.host, self.port = self._parse_host_port(new_url)
         
-        # Reset cache when changing server
+        # Reset caches when changing server
         self._info_cache = None
         self._info_cache_ts = None
+        self._health_cache = None
         
         self.logger.info(f"Updated Wyoming server: {old_host}:{old_port} -> {self.host}:{self.port}")
 
+    @property
+    def language(self) -> str | None:
+        return self._language
+
+    @language.setter
+    def language(self, value: str | None):
+        """Rebuild the cached Transcribe event along with the language."""
+        self._language = value
+        self._transcribe_event = Transcribe(language=value).event()
+
+    @staticmethod
+    def _parse_host_port(url: str) -> tuple[str, int]:
+        """Host and port of a scheme://host[:port] URL.
+
+        Plain host:port is split by hand; anything with a path, query, userinfo,
+        fragment or IPv6 literal goes through urlparse."""
+        rest = url.partition('://')[2]
+        if not any(c in rest for c in '/?@#['):
+            host, _, port = rest.partition(':')
+            if not port or port.isdigit():
+                return host.lower() or 'localhost', int(port) if port else 10300
+        parsed = urlparse(url)
+        return parsed.hostname or 'localhost', parsed.port or 10300
+
     @property
     def base_url(self) -> str:
         """UI compatibility - returns URL in host:port format."""
@@ -102,19 +150,42 @@ class WhisperEngine:
         self.update_server_url(url)
 
     def health_check(self) -> bool:
-        """Checks Wyoming server availability through TCP connection."""
+        """Checks Wyoming server availability through TCP connection.
+
+        The answer is reused for HEALTH_CACHE_TTL seconds."""
+        now = time.monotonic()
+        cached = self._health_cache
+        if cached is not None and now - cached[1] < self.HEALTH_CACHE_TTL:
+            return cached[0]
+        
+        ok = self._probe()
+        self._health_cache = (ok, now)
+        return ok
+
+    def _probe(self) -> bool:
         try:
             # Simple TCP connection check
-            import socket
             sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            sock.settimeout(5.0)
-            result = sock.connect_ex((self.host, self.port))
-            sock.close()
+            try:
+                sock.settimeout(5.0)
+                # Reset on close instead of leaving a TIME_WAIT socket per probe
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_LINGER, self._LINGER_OFF)
+                result = sock.connect_ex((self.host, self.port))
+            finally:
+                sock.close()
             return result == 0
         except Exception as e:
             self.logger.debug(f"Health check error: {e}")
             return False
 
+    @staticmethod
+    async def _safe_disconnect(client: AsyncTcpClient):
+        """Disconnect, ignoring errors from a connection that is already broken."""
+        try:
+            await client.disconnect()
+        except Exception:
+            pass
+
     async def _get_info(self) -> dict | None:
         """Gets server information through Wyoming protocol."""
         try:
@@ -122,13 +193,15 @@ class WhisperEngine:
             
             # Establish connection
             await client.connect()
-            
-            # Send information request
-            await client.write_event(Describe().event())
-            
-            # Wait for response
-            event = await asyncio.wait_for(client.read_event(), timeout=5.0)
-            await client.disconnect()
+            try:
+                # Send information request
+                await client.write_event(Describe().event())
+                
+                # Wait for response
+                event = await asyncio.wait_for(client.read_event(), timeout=5.0)
+            finally:
+                # Also on cancellation from _run's timeout
+                await self._safe_disconnect(client)
             
             if event and event.type == 'info':
                 return event.data
@@ -137,36 +210,83 @@ class WhisperEngine:
             self.logger.debug(f"Failed to get Wyoming info: {e}")
             return None
 
+    @staticmethod
+    def _models_from_info(info: dict) -> list[str] | None:
+        asr_info = info.get('asr', [])
+        if asr_info and len(asr_info) > 0:
+            models = asr_info[0].get('models', [])
+            return [model.get('name', '') for model in models if model.get('name')]
+        return None
+
+    def _loop(self) -> asyncio.AbstractEventLoop:
+        """Start the background loop thread on first use."""
+        with self._bg_lock:
+            if self._bg_loop is None or self._bg_loop.is_closed():
+                loop = asyncio.new_event_loop()
+                threading.Thread(target=loop.run_forever, name="wyoming-loop", daemon=True).start()
+                self._bg_loop = loop
+            return self._bg_loop
+
+    def _run(self, coro):
+        """Run a coroutine on the background loop and wait for its result."""
+        fut = asyncio.run_coroutine_threadsafe(coro, self._loop())
+        try:
+            return fut.result(timeout=self.timeout + 5)
+        except TimeoutError:
+            fut.cancel()
+            raise
+
+    def _warm_kernel(self):
+        try:
+            warm_up()
+        except Exception as e:
+            self.logger.debug(f"Audio kernel warm-up failed: {e}")
+
+    def close(self):
+        """Stop the background loop."""
+        with self._bg_lock:
+            loop, self._bg_loop = self._bg_loop, None
+        if loop is not None and loop.is_running():
+            loop.call_soon_threadsafe(loop.stop)
+
+    def _refresh_info(self) -> dict | None:
+        """Fetch server info and update the cache (blocking)."""
+        server = self.base_url
+        info = self._run(self._get_info())
+        if info and server == self.base_url:
+            self._info_cache = info
+            self._info_cache_ts = time.time()
+        return info
+
+    def _refresh_info_in_background(self):
+        if self._info_refreshing:
+            return
+        self._info_refreshing = True
+
+        def worker():
+            try:
+                self._refresh_info()
+            except Exception as e:
+                self.logger.debug(f"Background Wyoming info refresh failed: {e}")
+            finally:
+                self._info_refreshing = False
+
+        threading.Thread(target=worker, name="wyoming-info", daemon=True).start()
+
     def get_models(self, max_age: float = 60.0) -> list[str] | None:
-        """Get list of available models from Wyoming server. Caches result for max_age seconds."""
-        now = time.time()
-        if self._info_cache and self._info_cache_ts and (now - self._info_cache_ts) < max_age:
-            # Extract models from cached information
-            asr_info = self._info_cache.get('asr', [])
-            if asr_info and len(asr_info) > 0:
-                models = asr_info[0].get('models', [])
-                return [model.get('name', '') for model in models if model.get('name')]
+        """Get list of available models from Wyoming server.
+
+        Stale-while-revalidate: a cached answer is returned immediately and
+        refreshed in the background once older than max_age seconds. Only the
+        first call (or the first after a server change) blocks."""
+        if self._info_cache:
+            if self._info_cache_ts is None or (time.time() - self._info_cache_ts) >= max_age:
+                self._refresh_info_in_background()
+            return self._models_from_info(self._info_cache)
         
         try:
-            # Run asynchronous function in synchronous context
-            import asyncio
-            loop = None
-            try:
-                loop = asyncio.get_event_loop()
-            except RuntimeError:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-            
-            info = loop.run_until_complete(self._get_info())
-            if info:
-                self._info_cache = info
-                self._info_cache_ts = now
-                
-                asr_info = info.get('asr', [])
-                if asr_info and len(asr_info) > 0:
-                    models = asr_info[0].get('models', [])
-                    return [model.get('name', '') for model in models if model.get('name')]
-            return None
+            info = self._refresh_info()
+            return self._models_from_info(info) if info else None
         except Exception as e:
             self.logger.debug(f"Failed to fetch Wyoming models: {e}")
             return None
@@ -177,76 +297,90 @@ class WhisperEngine:
         return locally configured model."""
         return self.remote_model if self.remote_model else self.model_size
 
+    def _to_int16(self, block: np.ndarray) -> np.ndarray:
+        """Clamp up to STREAM_BLOCK float samples to [-1, 1] and scale to int16.
+
+        Everything runs in reused buffers; the result is a view that the next
+        call overwrites."""
+        if self._scratch_f32 is None:
+            self._scratch_f32 = np.empty(self.STREAM_BLOCK, dtype=np.float32)
+            self._scratch_i16 = np.empty(self.STREAM_BLOCK, dtype=np.int16)
+        out = self._scratch_i16[:block.shape[0]]
+        f32_to_i16(block, out, self._scratch_f32)
+        return out
+
     async def _transcribe_audio_async(self, audio_data: np.ndarray, sample_rate: int = SAMPLE_RATE) -> Optional[str]:
         """Asynchronous transcription through Wyoming protocol."""
         try:
-            # Connect to server
-            client = AsyncTcpClient(self.host, self.port)
-            await client.connect()
-            
             # Convert audio to required format
             if len(audio_data.shape) > 1:
                 audio_data = audio_data.flatten()
-            if audio_data.dtype != np.float32:
+            if audio_data.dtype.kind != 'f':
                 audio_data = audio_data.astype(np.float32)
             
-            # Normalize audio
-            audio_clip = np.clip(audio_data, -1.0, 1.0)
-            
-            # Convert to int16 for Wyoming
-            audio_int16 = (audio_clip * 32767).astype(np.int16)
-            audio_bytes = audio_int16.tobytes()
-            
-            # Send transcription request
-            transcribe_request = Transcribe(language=self.language).event()
-            await client.write_event(transcribe_request)
+            # Peak from two reductions, no temporary abs() array
+            peak = max(float(audio_data.max()), -float(audio_data.min()))
+            if peak < self.silence_threshold:
+                self.logger.info(f"Skipping silent recording (peak {peak:.4f})")
+                return None
             
-            # Send audio data
+            # Connect to server
+            client = AsyncTcpClient(self.host, self.port)
+            await client.connect()
+            try:
+                return await self._send_clip(client, audio_data, sample_rate)
+            finally:
+                await self._safe_disconnect(client)
+                    
+        except Exception as e:
+            self.logger.error(f"Wyoming transcription error: {e}")
+            return None
+
+    async def _send_clip(self, client: AsyncTcpClient, audio_data: np.ndarray, sample_rate: int) -> Optional[str]:
+        """Stream one clip over a connected client and wait for its transcript."""
+        # Send transcription request
+        await client.write_event(self._transcribe_event)
+        
+        # Send audio data
+        if sample_rate == self.SAMPLE_RATE:
+            audio_start = self._audio_start_event
+        else:
             audio_start = AudioStart(
                 rate=sample_rate,
                 width=2,  # 16-bit = 2 bytes
                 channels=1
             ).event()
-            await client.write_event(audio_start)
-            
-            # Send audio in chunks
-            chunk_size = 1024
-            for i in range(0, len(audio_bytes), chunk_size):
-                chunk = audio_bytes[i:i + chunk_size]
-                audio_chunk = AudioChunk(
-                    rate=sample_rate,
-                    width=2,
-                    channels=1,
-                    audio=chunk
-                ).event()
-                await client.write_event(audio_chunk)
-            
-            # Finish audio stream
-            audio_stop = AudioStop().event()
-            await client.write_event(audio_stop)
-            
-            # Wait for transcription result
-            while True:
-                event = await asyncio.wait_for(client.read_event(), timeout=self.timeout)
-                if event and event.type == 'transcript':
-                    text = event.data.get('text', '')
-                    await client.disconnect()
-                    # Clean multiple spaces and trim the result
-                    cleaned_text = self._clean_transcription_text(text)
-                    return cleaned_text if cleaned_text else None
-                elif event and event.type == 'error':
-                    error_msg = event.data.get('text', 'Unknown error')
-                    self.logger.error(f"Wyoming transcription error: {error_msg}")
-                    await client.disconnect()
-                    return None
-                    
-        except Exception as e:
-            self.logger.error(f"Wyoming transcription error: {e}")
-            try:
-                await client.disconnect()
-            except Exception:
-                pass
-            return None
+        await client.write_event(audio_start)
+        
+        # Convert to int16 one block at a time while sending, so only a block is
+        # held in int16 form; tobytes() copies it out of the reused scratch buffer
+        block = self.STREAM_BLOCK
+        # Loop-invariant lookups bound once
+        write_event = client.write_event
+        to_int16 = self._to_int16
+        mk_chunk = AudioChunk
+        rate = sample_rate
+        for i in range(0, audio_data.shape[0], block):
+            samples = to_int16(audio_data[i:i + block])
+            await write_event(mk_chunk(rate=rate, width=2, channels=1, audio=samples.tobytes()).event())
+        
+        # Finish audio stream
+        await client.write_event(self._audio_stop_event)
+        
+        # Wait for transcription result
+        while True:
+            event = await asyncio.wait_for(client.read_event(), timeout=self.timeout)
+            if event is None:
+                raise ConnectionError("Wyoming server closed the connection")
+            if event.type == 'transcript':
+                text = event.data.get('text', '')
+                # Clean multiple spaces and trim the result
+                cleaned_text = self._clean_transcription_text(text)
+                return cleaned_text if cleaned_text else None
+            elif event.type == 'error':
+                error_msg = event.data.get('text', 'Unknown error')
+                self.logger.error(f"Wyoming transcription error: {error_msg}")
+                return None
 
     def transcribe_audio(self, audio_data: np.ndarray, sample_rate: int = SAMPLE_RATE) -> Optional[str]:
         if audio_data is None or len(audio_data) == 0:
@@ -255,16 +389,8 @@ class WhisperEngine:
 
         try:
             # Run asynchronous transcription in synchronous context
-            import asyncio
-            loop = None
-            try:
-                loop = asyncio.get_event_loop()
-            except RuntimeError:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
-            
             start = time.time()
-            result = loop.run_until_complete(self._transcribe_audio_async(audio_data, sample_rate))
+            result = self._run(self._transcribe_audio_async(audio_data, sample_rate))
             elapsed = time.time() - start
             
             if result: